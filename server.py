@@ -8,13 +8,18 @@ device via its REST API.
 import asyncio
 import json
 import os
+import struct
+import time
+from collections.abc import Awaitable, Callable
 import httpx
+import jsonschema
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent, ImageContent, Prompt, PromptMessage, GetPromptResult
+from mcp.types import Tool, TextContent, ImageContent, CallToolResult, Prompt, PromptMessage, GetPromptResult
 from tools.utils import *
 from tools.c64_data import *
 from tools.screen import (
+    ScreenImage,
     capture_screen_logic,
     capture_screen_with_mode_logic,
     capture_screen_with_config_logic,
@@ -31,666 +36,876 @@ from tools.basic_tokenizer import basic_to_bytes, get_program_end_address, BASIC
 BASE_URL = os.environ.get("C64U_URL", "http://192.168.200.157")
 server = Server("c64u-mcp-server")
 
-# HTTP client with reasonable timeout
-def get_client() -> httpx.AsyncClient:
-    return httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+
+def _max_inflight() -> int:
+    """Read C64U_MAX_INFLIGHT, raising values below 1 to 1 so the pool can always hand out a connection."""
+    value = os.environ.get("C64U_MAX_INFLIGHT", "4")
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise SystemExit(f"C64U_MAX_INFLIGHT must be a whole number of requests, got {value!r}") from None
+
+
+# Maximum requests in flight to the device. Its small HTTP stack serves a few
+# connections well and queues the rest, so extra requests wait in our
+# connection pool instead - configurable via environment variable
+MAX_INFLIGHT = _max_inflight()
+
+# Per-phase timeouts: fail fast when the device is unreachable, but leave
+# enough read time for large memory dumps and uploads. Pool waits can span
+# several queued requests, so they get the same allowance as a read
+HTTP_TIMEOUT = httpx.Timeout(connect=2.0, read=30.0, write=10.0, pool=30.0)
+
+# Shared HTTP client, created on first use so connections to the device are
+# kept alive and reused across tool calls. Pooled connections belong to the
+# event loop that opened them, so the client is tied to that loop too
+_CLIENT: httpx.AsyncClient | None = None
+_CLIENT_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use in this event loop."""
+    global _CLIENT, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT_LOOP is not loop:
+        # A client left over from another (possibly closed) loop can't be
+        # reused or cleanly closed from here; drop it and start afresh
+        _CLIENT_LOOP = loop
+        _CLIENT = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=HTTP_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                # Each HTTP/1.1 connection carries one request at a time, so
+                # the pool size is the in-flight cap
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_INFLIGHT,
+                    max_connections=MAX_INFLIGHT,
+                    keepalive_expiry=60.0,
+                ),
+                retries=1,
+            ),
+        )
+    return _CLIENT
+
+
+# Short-lived cache for idempotent GETs whose results rarely change between
+# calls. Tools that change device state drop the affected paths, and the
+# short lifetimes cover changes made on the device itself. Lifetimes in seconds:
+VERSION_CACHE_TTL = 60.0
+CONFIG_CATEGORIES_CACHE_TTL = 30.0
+CONFIG_CACHE_TTL = 2.0
+DRIVES_CACHE_TTL = 2.0
+FILE_INFO_CACHE_TTL = 2.0
+
+# Most responses kept at once; expired entries are swept on every insert and
+# the oldest entries go first if the cache is still full
+GET_CACHE_MAX_ENTRIES = 256
+
+# path -> (expiry time, response text)
+_GET_CACHE: dict[str, tuple[float, str]] = {}
+_cache_generation = 0
+
+
+async def cached_get(client: httpx.AsyncClient, path: str, ttl: float) -> str:
+    """GET a path, reusing a response fetched within the last ttl seconds."""
+    cached = _GET_CACHE.get(path)
+    if cached is not None:
+        if time.monotonic() < cached[0]:
+            return cached[1]
+        del _GET_CACHE[path]
+
+    generation = _cache_generation
+    resp = await client.get(path)
+    resp.raise_for_status()
+    # Don't store a response that raced with a state change
+    if generation == _cache_generation:
+        _store_cached(path, resp.text, ttl)
+    return resp.text
+
+
+def _store_cached(path: str, text: str, ttl: float):
+    """Cache a response, dropping expired entries and capping the cache size."""
+    now = time.monotonic()
+    for key in [key for key, (expires, _) in _GET_CACHE.items() if expires <= now]:
+        del _GET_CACHE[key]
+    _GET_CACHE.pop(path, None)
+    while len(_GET_CACHE) >= GET_CACHE_MAX_ENTRIES:
+        del _GET_CACHE[next(iter(_GET_CACHE))]
+    _GET_CACHE[path] = (now + ttl, text)
+
+
+def invalidate_cache(*prefixes: str):
+    """Drop cached responses for paths starting with any of the given prefixes."""
+    global _cache_generation
+    _cache_generation += 1
+    for path in [path for path in _GET_CACHE if path.startswith(prefixes)]:
+        del _GET_CACHE[path]
+
+
+async def close_client():
+    """Close the shared HTTP client if it was created."""
+    global _CLIENT, _CLIENT_LOOP
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+        _CLIENT_LOOP = None
+
 
 # ============================================================================
 # Tool Definitions
 # ============================================================================
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """Return list of all available MCP tools."""
-    return [
-        # About
-        Tool(
-            name="get_version",
-            description="Get the REST API version number from the Commodore 64 Ultimate Computer device",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-
-        # Runners - SID
-        Tool(
-            name="sidplay_file",
-            description="Play a SID file located on the Commodore 64 Ultimate filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file": {"type": "string", "description": "Path to the SID file on the Commodore 64 Ultimate"},
-                    "songnr": {"type": "integer", "description": "Song number to play (optional)"},
-                },
-                "required": ["file"],
+# Screen mode names accepted by the capture tools. Kept as a list because
+# JSON Schema validation rejects tuples for "enum"; the joined text is used
+# in error messages
+_SCREEN_MODE_VALUES: list[str] = [m.value for m in VALID_SCREEN_MODES]
+_SCREEN_MODES_TEXT = ", ".join(_SCREEN_MODE_VALUES)
+
+# Input schema shared by tools that take no arguments. A plain dict because
+# the Tool model copies it on construction and JSON Schema validation
+# rejects tuples for "required"
+_NO_ARGS_SCHEMA: dict = {"type": "object", "properties": {}, "required": []}
+
+# Property schemas repeated across many tools, shared rather than rebuilt
+_DRIVE_PROP: dict = {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"}
+_ADDRESS_PROP: dict = {"type": "string", "description": "Memory address in hex (0000-ffff)"}
+_DISKNAME_PROP: dict = {"type": "string", "description": "Disk name (optional)"}
+_CATEGORY_PROP: dict = {"type": "string", "description": "Configuration category name"}
+
+# Most entries accepted by one batch_read_memory/batch_write_memory call, so a
+# single call cannot queue an unbounded burst of requests for the device
+BATCH_MAX_ITEMS = 64
+
+# Built once at import; the tool catalogue is static
+_TOOLS: list[Tool] = [
+    # About
+    Tool(
+        name="get_version",
+        description="Get the REST API version number from the Commodore 64 Ultimate Computer device",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+
+    # Runners - SID
+    Tool(
+        name="sidplay_file",
+        description="Play a SID file located on the Commodore 64 Ultimate filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file": {"type": "string", "description": "Path to the SID file on the Commodore 64 Ultimate"},
+                "songnr": {"type": "integer", "description": "Song number to play (optional)"},
             },
-        ),
-        Tool(
-            name="sidplay_upload",
-            description="Upload and play a SID file (pure base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data": {"type": "string", "description": "Base64 or data url encoded SID file data"},
-                    "songnr": {"type": "integer", "description": "Song number to play (optional)"},
-                },
-                "required": ["data"],
+            "required": ["file"],
+        },
+    ),
+    Tool(
+        name="sidplay_upload",
+        description="Upload and play a SID file (pure base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data": {"type": "string", "description": "Base64 or data url encoded SID file data"},
+                "songnr": {"type": "integer", "description": "Song number to play (optional)"},
             },
-        ),
-
-        # Runners - MOD
-        Tool(
-            name="modplay_file",
-            description="Play an Amiga MOD file located on the Commodore 64 Ultimate device filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file": {"type": "string", "description": "Path to the MOD file on the Commodore 64 Ultimate device"},
-                },
-                "required": ["file"],
+            "required": ["data"],
+        },
+    ),
+
+    # Runners - MOD
+    Tool(
+        name="modplay_file",
+        description="Play an Amiga MOD file located on the Commodore 64 Ultimate device filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file": {"type": "string", "description": "Path to the MOD file on the Commodore 64 Ultimate device"},
             },
-        ),
-        Tool(
-            name="modplay_upload",
-            description="Upload and play an Amiga MOD file (pure base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data": {"type": "string", "description": "Base64 or data URL encoded MOD file data"},
-                },
-                "required": ["data"],
+            "required": ["file"],
+        },
+    ),
+    Tool(
+        name="modplay_upload",
+        description="Upload and play an Amiga MOD file (pure base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data": {"type": "string", "description": "Base64 or data URL encoded MOD file data"},
             },
-        ),
-
-        # Runners - PRG
-        Tool(
-            name="load_prg_file",
-            description="Load a program file from filesystem without executing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file": {"type": "string", "description": "Path to the PRG file on the Commodore 64 Ultimate device"},
-                },
-                "required": ["file"],
+            "required": ["data"],
+        },
+    ),
+
+    # Runners - PRG
+    Tool(
+        name="load_prg_file",
+        description="Load a program file from filesystem without executing",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file": {"type": "string", "description": "Path to the PRG file on the Commodore 64 Ultimate device"},
             },
-        ),
-        Tool(
-            name="load_prg_upload",
-            description="Upload and load a program file without executing (base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data": {"type": "string", "description": "Base64 or data URL encoded PRG file data"},
-                },
-                "required": ["data"],
+            "required": ["file"],
+        },
+    ),
+    Tool(
+        name="load_prg_upload",
+        description="Upload and load a program file without executing (base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data": {"type": "string", "description": "Base64 or data URL encoded PRG file data"},
             },
-        ),
-        Tool(
-            name="run_prg_file",
-            description="Load and execute a program file from filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file": {"type": "string", "description": "Path to the PRG file on the Commodore 64 Ultimate device"},
-                },
-                "required": ["file"],
+            "required": ["data"],
+        },
+    ),
+    Tool(
+        name="run_prg_file",
+        description="Load and execute a program file from filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file": {"type": "string", "description": "Path to the PRG file on the Commodore 64 Ultimate device"},
             },
-        ),
-        Tool(
-            name="run_prg_upload",
-            description="Upload, load and execute a program file (base64 or data URL encoded) on the Commodore 64 Ultimate",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data": {"type": "string", "description": "Base64 or data URL encoded PRG file data"},
-                },
-                "required": ["data"],
+            "required": ["file"],
+        },
+    ),
+    Tool(
+        name="run_prg_upload",
+        description="Upload, load and execute a program file (base64 or data URL encoded) on the Commodore 64 Ultimate",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data": {"type": "string", "description": "Base64 or data URL encoded PRG file data"},
             },
-        ),
-
-        # Runners - CRT
-        Tool(
-            name="run_crt_file",
-            description="Start a cartridge file from filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file": {"type": "string", "description": "Path to the CRT file on the Commodore 64 Ultimate device"},
-                },
-                "required": ["file"],
+            "required": ["data"],
+        },
+    ),
+
+    # Runners - CRT
+    Tool(
+        name="run_crt_file",
+        description="Start a cartridge file from filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file": {"type": "string", "description": "Path to the CRT file on the Commodore 64 Ultimate device"},
             },
-        ),
-        Tool(
-            name="run_crt_upload",
-            description="Upload and start a cartridge file (base64 or data URL encoded) on the Commodore 64 Ultimate",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "data": {"type": "string", "description": "Base64 or data URL encoded CRT file data"},
-                },
-                "required": ["data"],
+            "required": ["file"],
+        },
+    ),
+    Tool(
+        name="run_crt_upload",
+        description="Upload and start a cartridge file (base64 or data URL encoded) on the Commodore 64 Ultimate",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "data": {"type": "string", "description": "Base64 or data URL encoded CRT file data"},
             },
-        ),
-
-        # Configuration
-        Tool(
-            name="list_config_categories",
-            description="List all configuration categories",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="get_config_category",
-            description="Get all configuration items in a category",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {"type": "string", "description": "Configuration category name"},
-                },
-                "required": ["category"],
+            "required": ["data"],
+        },
+    ),
+
+    # Configuration
+    Tool(
+        name="list_config_categories",
+        description="List all configuration categories",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="get_config_category",
+        description="Get all configuration items in a category",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": _CATEGORY_PROP,
             },
-        ),
-        Tool(
-            name="get_config_item",
-            description="Get a specific configuration item's details",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {"type": "string", "description": "Configuration category name"},
-                    "item": {"type": "string", "description": "Configuration item name"},
-                },
-                "required": ["category", "item"],
+            "required": ["category"],
+        },
+    ),
+    Tool(
+        name="get_config_item",
+        description="Get a specific configuration item's details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": _CATEGORY_PROP,
+                "item": {"type": "string", "description": "Configuration item name"},
             },
-        ),
-        Tool(
-            name="set_config_item",
-            description="Set a specific configuration item's value",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {"type": "string", "description": "Configuration category name"},
-                    "item": {"type": "string", "description": "Configuration item name"},
-                    "value": {"type": "string", "description": "New value for the configuration item"},
-                },
-                "required": ["category", "item", "value"],
+            "required": ["category", "item"],
+        },
+    ),
+    Tool(
+        name="set_config_item",
+        description="Set a specific configuration item's value",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": _CATEGORY_PROP,
+                "item": {"type": "string", "description": "Configuration item name"},
+                "value": {"type": "string", "description": "New value for the configuration item"},
             },
-        ),
-        Tool(
-            name="batch_set_config",
-            description="Set multiple configuration items at once",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "settings": {
-                        "type": "object",
-                        "description": "Object with category.item keys and their values",
-                        "additionalProperties": {"type": "string"},
-                    },
+            "required": ["category", "item", "value"],
+        },
+    ),
+    Tool(
+        name="batch_set_config",
+        description="Set multiple configuration items at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "settings": {
+                    "type": "object",
+                    "description": "Object with category.item keys and their values",
+                    "additionalProperties": {"type": "string"},
                 },
-                "required": ["settings"],
             },
-        ),
-        Tool(
-            name="load_config_from_flash",
-            description="Restore configuration from non-volatile memory",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="save_config_to_flash",
-            description="Save current configuration to non-volatile memory",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="reset_config_to_default",
-            description="Reset configuration to factory defaults",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-
-        # Machine
-        Tool(
-            name="machine_reset",
-            description="Send reset signal to the C64",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="machine_reboot",
-            description="Restart and reinitialize the Commodore 64 Ultimate device",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="machine_pause",
-            description="Halt the C64 CPU via DMA line",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="machine_resume",
-            description="Resume C64 from paused state",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="machine_poweroff",
-            description="Power down the machine (U64 only)",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="write_memory",
-            description="Write data to C64 memory via DMA",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "address": {"type": "string", "description": "Memory address in hex (0000-ffff)"},
-                    "data": {"type": "string", "description": "Hex string of bytes to write (e.g., 'A9008D2004')"},
-                },
-                "required": ["address", "data"],
+            "required": ["settings"],
+        },
+    ),
+    Tool(
+        name="load_config_from_flash",
+        description="Restore configuration from non-volatile memory",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="save_config_to_flash",
+        description="Save current configuration to non-volatile memory",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="reset_config_to_default",
+        description="Reset configuration to factory defaults",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+
+    # Machine
+    Tool(
+        name="machine_reset",
+        description="Send reset signal to the C64",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="machine_reboot",
+        description="Restart and reinitialize the Commodore 64 Ultimate device",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="machine_pause",
+        description="Halt the C64 CPU via DMA line",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="machine_resume",
+        description="Resume C64 from paused state",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="machine_poweroff",
+        description="Power down the machine (U64 only)",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="write_memory",
+        description="Write data to C64 memory via DMA",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": _ADDRESS_PROP,
+                "data": {"type": "string", "description": "Hex string of bytes to write (e.g., 'A9008D2004')"},
             },
-        ),
-        Tool(
-            name="write_memory_binary",
-            description="Write binary data to C64 memory via DMA (base64 or data URL encoded)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "address": {"type": "string", "description": "Memory address in hex (0000-ffff)"},
-                    "data": {"type": "string", "description": "Base64 or data URL encoded binary data"},
-                },
-                "required": ["address", "data"],
+            "required": ["address", "data"],
+        },
+    ),
+    Tool(
+        name="write_memory_binary",
+        description="Write binary data to C64 memory via DMA (base64 or data URL encoded)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": _ADDRESS_PROP,
+                "data": {"type": "string", "description": "Base64 or data URL encoded binary data"},
             },
-        ),
-        Tool(
-            name="read_memory",
-            description="Read data from C64 memory",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "address": {"type": "string", "description": "Memory address in hex (0000-ffff)"},
-                    "length": {"type": "integer", "description": "Number of bytes to read (default: 256)"},
-                },
-                "required": ["address"],
+            "required": ["address", "data"],
+        },
+    ),
+    Tool(
+        name="read_memory",
+        description="Read data from C64 memory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "address": _ADDRESS_PROP,
+                "length": {"type": "integer", "description": "Number of bytes to read (default: 256)"},
             },
-        ),
-        Tool(
-            name="read_debug_register",
-            description="Read debug register (U64 only)",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="write_debug_register",
-            description="Write debug register (U64 only)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "value": {"type": "integer", "description": "Value to write to debug register"},
+            "required": ["address"],
+        },
+    ),
+    Tool(
+        name="batch_read_memory",
+        description="Read several C64 memory ranges in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ranges": {
+                    "type": "array",
+                    "description": "Memory ranges to read",
+                    "minItems": 1,
+                    "maxItems": BATCH_MAX_ITEMS,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "address": _ADDRESS_PROP,
+                            "length": {"type": "integer", "description": "Number of bytes to read (default: 256)"},
+                        },
+                        "required": ["address"],
+                    },
                 },
-                "required": ["value"],
             },
-        ),
-        Tool(
-            name="capture_screen",
-            description="Capture the C64 screen as a PNG image. Auto-detects the active graphics mode and renders accordingly. Supported modes: Standard Text (40x25), Multicolor Text, Extended Background Color (ECM), Standard Bitmap (Hires 320x200), and Multicolor Bitmap (160x200). Returns base64 encoded PNG data with mode info.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scale": {
-                        "type": "integer",
-                        "description": "Scale factor for the output image (1-4, default: 2)",
-                        "minimum": 1,
-                        "maximum": 4,
-                    },
-                    "include_border": {
-                        "type": "boolean",
-                        "description": "Include the border area in the screenshot (default: true)",
+            "required": ["ranges"],
+        },
+    ),
+    Tool(
+        name="batch_write_memory",
+        description="Write data to several C64 memory locations via DMA in one call. Writes are applied in list order; if one fails, the earlier ones have already been written",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "writes": {
+                    "type": "array",
+                    "description": "Memory writes to perform",
+                    "minItems": 1,
+                    "maxItems": BATCH_MAX_ITEMS,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "address": _ADDRESS_PROP,
+                            "data": {"type": "string", "description": "Hex string of bytes to write (e.g., 'A9008D2004')"},
+                        },
+                        "required": ["address", "data"],
                     },
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="get_screen_mode",
-            description="Detect and return the currently active C64 screen mode and memory configuration. Reads CIA2 ($DD00) and VIC register ($D018) to properly detect custom screen memory locations (not just standard $0400). Returns mode enum, VIC bank info, screen/char/bitmap addresses, and flags for non-standard configurations used by demos, games, and tools like TASM.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": [],
+            "required": ["writes"],
+        },
+    ),
+    Tool(
+        name="read_debug_register",
+        description="Read debug register (U64 only)",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="write_debug_register",
+        description="Write debug register (U64 only)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "value": {"type": "integer", "description": "Value to write to debug register"},
             },
-        ),
-        Tool(
-            name="capture_screen_with_mode",
-            description="Capture the C64 screen using an explicit screen mode, ignoring the active VIC-II mode. Useful when auto-detection may not match the expected rendering.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "mode": {
-                        "type": "string",
-                        "description": "Screen mode to use for rendering",
-                        "enum": [m.value for m in VALID_SCREEN_MODES],
-                    },
-                    "scale": {
-                        "type": "integer",
-                        "description": "Scale factor for the output image (1-4, default: 2)",
-                        "minimum": 1,
-                        "maximum": 4,
-                    },
-                    "include_border": {
-                        "type": "boolean",
-                        "description": "Include the border area in the screenshot (default: true)",
-                    },
+            "required": ["value"],
+        },
+    ),
+    Tool(
+        name="capture_screen",
+        description="Capture the C64 screen as a PNG image. Auto-detects the active graphics mode and renders accordingly. Supported modes: Standard Text (40x25), Multicolor Text, Extended Background Color (ECM), Standard Bitmap (Hires 320x200), and Multicolor Bitmap (160x200). Returns base64 encoded PNG data with mode info.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scale": {
+                    "type": "integer",
+                    "description": "Scale factor for the output image (1-4, default: 2)",
+                    "minimum": 1,
+                    "maximum": 4,
                 },
-                "required": ["mode"],
-            },
-        ),
-        Tool(
-            name="capture_all_screen_modes",
-            description="Capture screenshots for all valid C64 screen modes at once. Returns multiple images, one for each mode (standard_text, multicolor_text, extended_bg_color, standard_bitmap, multicolor_bitmap). Useful for debugging or when the active mode is uncertain.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scale": {
-                        "type": "integer",
-                        "description": "Scale factor for the output images (1-4, default: 2)",
-                        "minimum": 1,
-                        "maximum": 4,
-                    },
-                    "include_border": {
-                        "type": "boolean",
-                        "description": "Include the border area in the screenshots (default: true)",
-                    },
+                "include_border": {
+                    "type": "boolean",
+                    "description": "Include the border area in the screenshot (default: true)",
                 },
-                "required": [],
             },
-        ),
-        Tool(
-            name="capture_screen_with_config",
-            description="Capture the C64 screen using explicit mode AND memory addresses. Bypasses VIC-II register detection entirely. Use this for programs with custom screen memory layouts (like TASM at $0800) or when auto-detection fails.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "mode": {
-                        "type": "string",
-                        "description": "Screen mode to use for rendering",
-                        "enum": [m.value for m in VALID_SCREEN_MODES],
-                    },
-                    "screen_addr": {
-                        "type": "string",
-                        "description": "Screen RAM address in hex (1KB aligned: 0400, 0800, 0C00, 1000, etc.)",
-                    },
-                    "char_addr": {
-                        "type": "string",
-                        "description": "Character RAM address in hex for text modes (2KB aligned: 1000, 1800, 2000, etc.). Omit to use ROM charset.",
-                    },
-                    "bitmap_addr": {
-                        "type": "string",
-                        "description": "Bitmap address in hex for bitmap modes (8KB aligned: 0000, 2000, 4000, etc.). Default: 2000",
-                    },
-                    "scale": {
-                        "type": "integer",
-                        "description": "Scale factor for the output image (1-4, default: 2)",
-                        "minimum": 1,
-                        "maximum": 4,
-                    },
-                    "include_border": {
-                        "type": "boolean",
-                        "description": "Include the border area in the screenshot (default: true)",
-                    },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_screen_mode",
+        description="Detect and return the currently active C64 screen mode and memory configuration. Reads CIA2 ($DD00) and VIC register ($D018) to properly detect custom screen memory locations (not just standard $0400). Returns mode enum, VIC bank info, screen/char/bitmap addresses, and flags for non-standard configurations used by demos, games, and tools like TASM.",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="capture_screen_with_mode",
+        description="Capture the C64 screen using an explicit screen mode, ignoring the active VIC-II mode. Useful when auto-detection may not match the expected rendering.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mode": {
+                    "type": "string",
+                    "description": "Screen mode to use for rendering",
+                    "enum": _SCREEN_MODE_VALUES,
                 },
-                "required": ["mode", "screen_addr"],
-            },
-        ),
-        Tool(
-            name="type_text",
-            description="Type text into the C64 keyboard buffer. Converts ASCII to PETSCII and writes to the keyboard buffer at $0277. The C64 will process these keystrokes. Automatically handles text longer than 10 chars by chunking. Use {RETURN} for newline, {CLR} to clear screen, {HOME} for home, {UP}/{DOWN}/{LEFT}/{RIGHT} for cursor, {F1}-{F8} for function keys, {DEL}/{INS} for delete/insert.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "Text to type. Use placeholders for special keys: {RETURN}, {HOME}, {CLR}, {UP}, {DOWN}, {LEFT}, {RIGHT}, {DEL}, {INS}, {F1}-{F8}, {STOP}. Letters are converted to uppercase PETSCII.",
-                    },
-                    "wait_ms": {
-                        "type": "integer",
-                        "description": "Milliseconds to wait after typing for buffer to be processed (default: 100)",
-                        "minimum": 0,
-                        "maximum": 5000,
-                    },
+                "scale": {
+                    "type": "integer",
+                    "description": "Scale factor for the output image (1-4, default: 2)",
+                    "minimum": 1,
+                    "maximum": 4,
                 },
-                "required": ["text"],
-            },
-        ),
-        Tool(
-            name="send_key",
-            description="Send a special key to the C64 keyboard buffer. For control keys that can't be easily typed as text.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "key": {
-                        "type": "string",
-                        "description": "Special key name",
-                        "enum": ["RETURN", "HOME", "CLR", "DEL", "INS", "UP", "DOWN", "LEFT", "RIGHT", "F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "RUN_STOP"],
-                    },
+                "include_border": {
+                    "type": "boolean",
+                    "description": "Include the border area in the screenshot (default: true)",
                 },
-                "required": ["key"],
             },
-        ),
-        Tool(
-            name="enter_basic_program",
-            description="Enter a BASIC program directly into C64 memory. Takes BASIC source code text, tokenizes it, and writes it to memory at $0801. Updates BASIC pointers so the program is ready to LIST or RUN. Each line must have a line number (e.g., '10 PRINT \"HELLO\"'). Keywords are automatically tokenized. Use NEW on the C64 first to clear any existing program.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "program": {
-                        "type": "string",
-                        "description": "BASIC program source code. Each line must start with a line number (0-63999). Lines are separated by newlines. Example: '10 PRINT \"HELLO\"\\n20 GOTO 10'",
-                    },
-                    "auto_run": {
-                        "type": "boolean",
-                        "description": "If true, automatically type RUN after entering the program (default: false)",
-                    },
+            "required": ["mode"],
+        },
+    ),
+    Tool(
+        name="capture_all_screen_modes",
+        description="Capture screenshots for all valid C64 screen modes at once. Returns multiple images, one for each mode (standard_text, multicolor_text, extended_bg_color, standard_bitmap, multicolor_bitmap). Useful for debugging or when the active mode is uncertain.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scale": {
+                    "type": "integer",
+                    "description": "Scale factor for the output images (1-4, default: 2)",
+                    "minimum": 1,
+                    "maximum": 4,
                 },
-                "required": ["program"],
-            },
-        ),
-
-        # Drives
-        Tool(
-            name="list_drives",
-            description="Get information about all floppy drives and mounted images",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="mount_disk_file",
-            description="Mount a disk image from filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
-                    "image": {"type": "string", "description": "Path to disk image on Commodore 64 Ultimate device"},
-                    "type": {"type": "string", "description": "Disk type (optional)"},
-                    "mode": {"type": "string", "description": "Mount mode (optional)"},
+                "include_border": {
+                    "type": "boolean",
+                    "description": "Include the border area in the screenshots (default: true)",
                 },
-                "required": ["drive", "image"],
             },
-        ),
-        Tool(
-            name="mount_disk_upload",
-            description="Upload and mount a disk image (base64 or data URL encoded) on the Commodore 64 Ultimate",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
-                    "data": {"type": "string", "description": "Base64 or data URL encoded disk image data"},
-                    "type": {"type": "string", "description": "Disk type (optional)"},
-                    "mode": {"type": "string", "description": "Mount mode (optional)"},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="capture_screen_with_config",
+        description="Capture the C64 screen using explicit mode AND memory addresses. Bypasses VIC-II register detection entirely. Use this for programs with custom screen memory layouts (like TASM at $0800) or when auto-detection fails.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mode": {
+                    "type": "string",
+                    "description": "Screen mode to use for rendering",
+                    "enum": _SCREEN_MODE_VALUES,
                 },
-                "required": ["drive", "data"],
-            },
-        ),
-        Tool(
-            name="drive_reset",
-            description="Reset a specific drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
+                "screen_addr": {
+                    "type": "string",
+                    "description": "Screen RAM address in hex (1KB aligned: 0400, 0800, 0C00, 1000, etc.)",
                 },
-                "required": ["drive"],
-            },
-        ),
-        Tool(
-            name="drive_remove",
-            description="Unmount disk image from drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
+                "char_addr": {
+                    "type": "string",
+                    "description": "Character RAM address in hex for text modes (2KB aligned: 1000, 1800, 2000, etc.). Omit to use ROM charset.",
                 },
-                "required": ["drive"],
-            },
-        ),
-        Tool(
-            name="drive_on",
-            description="Enable a drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
+                "bitmap_addr": {
+                    "type": "string",
+                    "description": "Bitmap address in hex for bitmap modes (8KB aligned: 0000, 2000, 4000, etc.). Default: 2000",
                 },
-                "required": ["drive"],
-            },
-        ),
-        Tool(
-            name="drive_off",
-            description="Disable a drive",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
+                "scale": {
+                    "type": "integer",
+                    "description": "Scale factor for the output image (1-4, default: 2)",
+                    "minimum": 1,
+                    "maximum": 4,
                 },
-                "required": ["drive"],
-            },
-        ),
-        Tool(
-            name="drive_load_rom_file",
-            description="Load custom ROM for drive from filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
-                    "file": {"type": "string", "description": "Path to ROM file on Commodore 64 Ultimate device"},
+                "include_border": {
+                    "type": "boolean",
+                    "description": "Include the border area in the screenshot (default: true)",
                 },
-                "required": ["drive", "file"],
             },
-        ),
-        Tool(
-            name="drive_load_rom_upload",
-            description="Upload and load custom ROM for drive (base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
-                    "data": {"type": "string", "description": "Base64 or data URL encoded ROM data"},
+            "required": ["mode", "screen_addr"],
+        },
+    ),
+    Tool(
+        name="type_text",
+        description="Type text into the C64 keyboard buffer. Converts ASCII to PETSCII and writes to the keyboard buffer at $0277. The C64 will process these keystrokes. Automatically handles text longer than 10 chars by chunking. Use {RETURN} for newline, {CLR} to clear screen, {HOME} for home, {UP}/{DOWN}/{LEFT}/{RIGHT} for cursor, {F1}-{F8} for function keys, {DEL}/{INS} for delete/insert.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "Text to type. Use placeholders for special keys: {RETURN}, {HOME}, {CLR}, {UP}, {DOWN}, {LEFT}, {RIGHT}, {DEL}, {INS}, {F1}-{F8}, {STOP}. Letters are converted to uppercase PETSCII.",
                 },
-                "required": ["drive", "data"],
-            },
-        ),
-        Tool(
-            name="drive_set_mode",
-            description="Change drive type (1541/1571/1581)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "drive": {"type": "string", "description": "Drive identifier (e.g., 'a', 'b')"},
-                    "mode": {"type": "string", "description": "Drive mode (1541, 1571, or 1581)"},
+                "wait_ms": {
+                    "type": "integer",
+                    "description": "Milliseconds to wait after typing for buffer to be processed (default: 100)",
+                    "minimum": 0,
+                    "maximum": 5000,
                 },
-                "required": ["drive", "mode"],
             },
-        ),
-
-        # Streams (U64 only)
-        Tool(
-            name="stream_start",
-            description="Start a video/audio/debug stream (U64 only)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "stream": {"type": "string", "description": "Stream name (e.g., 'video', 'audio', 'debug')"},
-                    "ip": {"type": "string", "description": "Target IP address for stream"},
+            "required": ["text"],
+        },
+    ),
+    Tool(
+        name="send_key",
+        description="Send a special key to the C64 keyboard buffer. For control keys that can't be easily typed as text.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Special key name",
+                    "enum": ["RETURN", "HOME", "CLR", "DEL", "INS", "UP", "DOWN", "LEFT", "RIGHT", "F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "RUN_STOP"],
                 },
-                "required": ["stream", "ip"],
             },
-        ),
-        Tool(
-            name="stream_stop",
-            description="Stop an active stream (U64 only)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "stream": {"type": "string", "description": "Stream name (e.g., 'video', 'audio', 'debug')"},
+            "required": ["key"],
+        },
+    ),
+    Tool(
+        name="enter_basic_program",
+        description="Enter a BASIC program directly into C64 memory. Takes BASIC source code text, tokenizes it, and writes it to memory at $0801. Updates BASIC pointers so the program is ready to LIST or RUN. Each line must have a line number (e.g., '10 PRINT \"HELLO\"'). Keywords are automatically tokenized. Use NEW on the C64 first to clear any existing program.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "program": {
+                    "type": "string",
+                    "description": "BASIC program source code. Each line must start with a line number (0-63999). Lines are separated by newlines. Example: '10 PRINT \"HELLO\"\\n20 GOTO 10'",
                 },
-                "required": ["stream"],
-            },
-        ),
-
-        # Files
-        Tool(
-            name="get_file_info",
-            description="Get metadata about a file on the Commodore 64 Ultimate device",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path to file on Commodore 64 Ultimate device"},
+                "auto_run": {
+                    "type": "boolean",
+                    "description": "If true, automatically type RUN after entering the program (default: false)",
                 },
-                "required": ["path"],
             },
-        ),
-        Tool(
-            name="create_d64",
-            description="Create a new D64 disk image",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path where to create the D64 file"},
-                    "tracks": {"type": "integer", "description": "Number of tracks (default: 35)"},
-                    "diskname": {"type": "string", "description": "Disk name (optional)"},
-                },
-                "required": ["path"],
+            "required": ["program"],
+        },
+    ),
+
+    # Drives
+    Tool(
+        name="list_drives",
+        description="Get information about all floppy drives and mounted images",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="mount_disk_file",
+        description="Mount a disk image from filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+                "image": {"type": "string", "description": "Path to disk image on Commodore 64 Ultimate device"},
+                "type": {"type": "string", "description": "Disk type (optional)"},
+                "mode": {"type": "string", "description": "Mount mode (optional)"},
             },
-        ),
-        Tool(
-            name="create_d71",
-            description="Create a new D71 disk image",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path where to create the D71 file"},
-                    "diskname": {"type": "string", "description": "Disk name (optional)"},
-                },
-                "required": ["path"],
+            "required": ["drive", "image"],
+        },
+    ),
+    Tool(
+        name="mount_disk_upload",
+        description="Upload and mount a disk image (base64 or data URL encoded) on the Commodore 64 Ultimate",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+                "data": {"type": "string", "description": "Base64 or data URL encoded disk image data"},
+                "type": {"type": "string", "description": "Disk type (optional)"},
+                "mode": {"type": "string", "description": "Mount mode (optional)"},
             },
-        ),
-        Tool(
-            name="create_d81",
-            description="Create a new D81 disk image",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path where to create the D81 file"},
-                    "diskname": {"type": "string", "description": "Disk name (optional)"},
-                },
-                "required": ["path"],
+            "required": ["drive", "data"],
+        },
+    ),
+    Tool(
+        name="drive_reset",
+        description="Reset a specific drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
             },
-        ),
-        Tool(
-            name="create_dnp",
-            description="Create a new DNP disk image",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path where to create the DNP file"},
-                    "tracks": {"type": "integer", "description": "Number of tracks"},
-                    "diskname": {"type": "string", "description": "Disk name (optional)"},
-                },
-                "required": ["path", "tracks"],
+            "required": ["drive"],
+        },
+    ),
+    Tool(
+        name="drive_remove",
+        description="Unmount disk image from drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+            },
+            "required": ["drive"],
+        },
+    ),
+    Tool(
+        name="drive_on",
+        description="Enable a drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+            },
+            "required": ["drive"],
+        },
+    ),
+    Tool(
+        name="drive_off",
+        description="Disable a drive",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+            },
+            "required": ["drive"],
+        },
+    ),
+    Tool(
+        name="drive_load_rom_file",
+        description="Load custom ROM for drive from filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+                "file": {"type": "string", "description": "Path to ROM file on Commodore 64 Ultimate device"},
+            },
+            "required": ["drive", "file"],
+        },
+    ),
+    Tool(
+        name="drive_load_rom_upload",
+        description="Upload and load custom ROM for drive (base64 or data URL encoded) from the Commodore 64 Ultimate filesystem",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+                "data": {"type": "string", "description": "Base64 or data URL encoded ROM data"},
+            },
+            "required": ["drive", "data"],
+        },
+    ),
+    Tool(
+        name="drive_set_mode",
+        description="Change drive type (1541/1571/1581)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "drive": _DRIVE_PROP,
+                "mode": {"type": "string", "description": "Drive mode (1541, 1571, or 1581)"},
+            },
+            "required": ["drive", "mode"],
+        },
+    ),
+
+    # Streams (U64 only)
+    Tool(
+        name="stream_start",
+        description="Start a video/audio/debug stream (U64 only)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "stream": {"type": "string", "description": "Stream name (e.g., 'video', 'audio', 'debug')"},
+                "ip": {"type": "string", "description": "Target IP address for stream"},
+            },
+            "required": ["stream", "ip"],
+        },
+    ),
+    Tool(
+        name="stream_stop",
+        description="Stop an active stream (U64 only)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "stream": {"type": "string", "description": "Stream name (e.g., 'video', 'audio', 'debug')"},
+            },
+            "required": ["stream"],
+        },
+    ),
+
+    # Files
+    Tool(
+        name="get_file_info",
+        description="Get metadata about a file on the Commodore 64 Ultimate device",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path to file on Commodore 64 Ultimate device"},
             },
-        ),
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="create_d64",
+        description="Create a new D64 disk image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path where to create the D64 file"},
+                "tracks": {"type": "integer", "description": "Number of tracks (default: 35)"},
+                "diskname": _DISKNAME_PROP,
+            },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="create_d71",
+        description="Create a new D71 disk image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path where to create the D71 file"},
+                "diskname": _DISKNAME_PROP,
+            },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="create_d81",
+        description="Create a new D81 disk image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path where to create the D81 file"},
+                "diskname": _DISKNAME_PROP,
+            },
+            "required": ["path"],
+        },
+    ),
+    Tool(
+        name="create_dnp",
+        description="Create a new DNP disk image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path where to create the DNP file"},
+                "tracks": {"type": "integer", "description": "Number of tracks"},
+                "diskname": _DISKNAME_PROP,
+            },
+            "required": ["path", "tracks"],
+        },
+    ),
+]
+
+
+def _strip_descriptions(schema):
+    """Copy a JSON schema without its "description" annotations, at any depth."""
+    if isinstance(schema, dict):
+        return {
+            key: _strip_descriptions(value)
+            for key, value in schema.items()
+            if not (key == "description" and isinstance(value, str))
+        }
+    if isinstance(schema, list):
+        return [_strip_descriptions(value) for value in schema]
+    return schema
+
+
+# C64U_MIN_SCHEMA=1 drops argument descriptions from the tool list for clients
+# that do not need them; tool descriptions are kept for tool selection
+if os.environ.get("C64U_MIN_SCHEMA") == "1":
+    _TOOLS = [
+        tool.model_copy(update={"inputSchema": _strip_descriptions(tool.inputSchema)})
+        for tool in _TOOLS
     ]
 
 
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """Return list of all available MCP tools."""
+    return _TOOLS
+
+
+# Argument validators, built once per tool. jsonschema.validate() would check
+# the schema itself against the metaschema again on every call
+_VALIDATORS = {
+    tool.name: jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in _TOOLS
+}
+
+
 # ============================================================================
 # Prompts
 # ============================================================================
@@ -731,15 +946,18 @@ Common causes of detection issues:
 - Programs that haven't fully initialized the display yet"""
 
 
+_PROMPTS: list[Prompt] = [
+    Prompt(
+        name="screen_capture_guide",
+        description="Guide for capturing C64 screen with troubleshooting tips for visual artifacts",
+    ),
+]
+
+
 @server.list_prompts()
 async def list_prompts() -> list[Prompt]:
     """Return list of available prompts."""
-    return [
-        Prompt(
-            name="screen_capture_guide",
-            description="Guide for capturing C64 screen with troubleshooting tips for visual artifacts",
-        ),
-    ]
+    return _PROMPTS
 
 
 @server.get_prompt()
@@ -761,486 +979,669 @@ async def get_prompt(name: str, arguments: dict | None = None) -> GetPromptResul
 # Tool Handlers
 # ============================================================================
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent]:
+# Handlers return text, or rendered screen captures for the capture tools
+ToolResult = str | ScreenImage | list[ScreenImage]
+
+# BASIC programs shorter than this (in characters) are tokenized inline;
+# below it the thread hand-off costs more than the tokenizing itself
+_INLINE_TOKENIZE_LIMIT = 512
+
+# Bytes of an HTTP error response body included in the tool result
+ERROR_BODY_LIMIT = 4096
+
+# BASIC zero-page pointers $2B-$32: start of BASIC, start of variables,
+# start of arrays and end of arrays, as little-endian words
+_BASIC_POINTERS = struct.Struct("<HHHH")
+
+
+@server.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: dict) -> list[TextContent | ImageContent] | CallToolResult:
     """Handle tool calls."""
-    async with get_client() as client:
-        try:
-            result = await _handle_tool(client, name, arguments)
-            # Handle multiple image responses (e.g., capture_all_screen_modes)
-            if isinstance(result, list):
-                contents = []
-                for item in result:
-                    if isinstance(item, dict) and item.get("type") == "image":
-                        contents.append(TextContent(type="text", text=item.get("info", "")))
-                        contents.append(ImageContent(type="image", data=item["data"], mimeType=item["mimeType"]))
-                return contents if contents else [TextContent(type="text", text="No results")]
-            # Handle single image response
-            if isinstance(result, dict) and result.get("type") == "image":
-                return [
-                    TextContent(type="text", text=result.get("info", "")),
-                    ImageContent(type="image", data=result["data"], mimeType=result["mimeType"])
-                ]
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+        if error is not None:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"Input validation error: {error.message}")],
+                isError=True,
+            )
+
+    client = await get_client()
+    try:
+        result = await _handle_tool(client, name, arguments)
+        if isinstance(result, str):
             return [TextContent(type="text", text=result)]
-        except httpx.HTTPStatusError as e:
-            return [TextContent(type="text", text=f"HTTP Error {e.response.status_code}: {e.response.text}")]
-        except httpx.RequestError as e:
-            return [TextContent(type="text", text=f"Request Error: {str(e)}")]
-        except Exception as e:
-            return [TextContent(type="text", text=f"Error: {str(e)}")]
 
+        # Screen captures: one image, or a list of them (capture_all_screen_modes),
+        # each preceded by its description
+        images = result if isinstance(result, list) else [result]
+        contents = []
+        for image in images:
+            contents.append(TextContent(type="text", text=image.info))
+            contents.append(ImageContent(type="image", data=image.data, mimeType=image.mime_type))
+        return contents if contents else [TextContent(type="text", text="No results")]
+    except httpx.HTTPStatusError as e:
+        # Only decode the start of the body; an error page is not worth more
+        body = e.response.content[:ERROR_BODY_LIMIT].decode(e.response.encoding or "utf-8", errors="replace")
+        return [TextContent(type="text", text=f"HTTP Error {e.response.status_code}: {body}")]
+    except httpx.RequestError as e:
+        return [TextContent(type="text", text=f"Request Error: {str(e)}")]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
 
-async def _handle_tool(client: httpx.AsyncClient, name: str, args: dict) -> str:
-    """Route tool calls to appropriate handlers."""
 
-    # About
-    if name == "get_version":
-        resp = await client.get("/v1/version")
-        resp.raise_for_status()
-        return resp.text
+# About
+async def _h_get_version(client: httpx.AsyncClient, args: dict) -> str:
+    return await cached_get(client, "/v1/version", VERSION_CACHE_TTL)
 
-    # Runners - SID
-    elif name == "sidplay_file":
-        params = {"file": args["file"]}
-        if "songnr" in args:
-            params["songnr"] = args["songnr"]
-        resp = await client.put("/v1/runners:sidplay", params=params)
-        resp.raise_for_status()
-        return resp.text or "SID playback started"
-
-    elif name == "sidplay_upload":
-        data = decode_base64_data(args["data"])
-        params = {}
-        if "songnr" in args:
-            params["songnr"] = args["songnr"]
-        resp = await client.post("/v1/runners:sidplay", params=params, content=data)
-        resp.raise_for_status()
-        return resp.text or "SID playback started"
 
-    # Runners - MOD
-    elif name == "modplay_file":
-        resp = await client.put("/v1/runners:modplay", params={"file": args["file"]})
-        resp.raise_for_status()
-        return resp.text or "MOD playback started"
+# Runners - SID
+async def _h_sidplay_file(client: httpx.AsyncClient, args: dict) -> str:
+    params = {"file": args["file"]}
+    if "songnr" in args:
+        params["songnr"] = args["songnr"]
+    resp = await client.put("/v1/runners:sidplay", params=params)
+    resp.raise_for_status()
+    return resp.text or "SID playback started"
 
-    elif name == "modplay_upload":
-        data = decode_base64_data(args["data"])
-        resp = await client.post("/v1/runners:modplay", content=data)
-        resp.raise_for_status()
-        return resp.text or "MOD playback started"
 
-    # Runners - PRG
-    elif name == "load_prg_file":
-        resp = await client.put("/v1/runners:load_prg", params={"file": args["file"]})
-        resp.raise_for_status()
-        return resp.text or "Program loaded"
+async def _h_sidplay_upload(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    params = {}
+    if "songnr" in args:
+        params["songnr"] = args["songnr"]
+    resp = await client.post("/v1/runners:sidplay", params=params, content=data, headers=headers)
+    resp.raise_for_status()
+    return resp.text or "SID playback started"
 
-    elif name == "load_prg_upload":
-        data = decode_base64_data(args["data"])
-        resp = await client.post("/v1/runners:load_prg", content=data)
-        resp.raise_for_status()
-        return resp.text or "Program loaded"
 
-    elif name == "run_prg_file":
-        resp = await client.put("/v1/runners:run_prg", params={"file": args["file"]})
-        resp.raise_for_status()
-        return resp.text or "Program running"
+# Runners - MOD
+async def _h_modplay_file(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/runners:modplay", params={"file": args["file"]})
+    resp.raise_for_status()
+    return resp.text or "MOD playback started"
 
-    elif name == "run_prg_upload":
-        data = decode_base64_data(args["data"])
-        resp = await client.post("/v1/runners:run_prg", content=data)
-        resp.raise_for_status()
-        return resp.text or "Program running"
 
-    # Runners - CRT
-    elif name == "run_crt_file":
-        resp = await client.put("/v1/runners:run_crt", params={"file": args["file"]})
-        resp.raise_for_status()
-        return resp.text or "Cartridge started"
+async def _h_modplay_upload(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    resp = await client.post("/v1/runners:modplay", content=data, headers=headers)
+    resp.raise_for_status()
+    return resp.text or "MOD playback started"
 
-    elif name == "run_crt_upload":
-        data = decode_base64_data(args["data"])
-        resp = await client.post("/v1/runners:run_crt", content=data)
-        resp.raise_for_status()
-        return resp.text or "Cartridge started"
 
-    # Configuration
-    elif name == "list_config_categories":
-        resp = await client.get("/v1/configs")
-        resp.raise_for_status()
-        return resp.text
+# Runners - PRG
+async def _h_load_prg_file(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/runners:load_prg", params={"file": args["file"]})
+    resp.raise_for_status()
+    return resp.text or "Program loaded"
 
-    elif name == "get_config_category":
-        resp = await client.get(f"/v1/configs/{args['category']}")
-        resp.raise_for_status()
-        return resp.text
 
-    elif name == "get_config_item":
-        resp = await client.get(f"/v1/configs/{args['category']}/{args['item']}")
-        resp.raise_for_status()
-        return resp.text
+async def _h_load_prg_upload(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    resp = await client.post("/v1/runners:load_prg", content=data, headers=headers)
+    resp.raise_for_status()
+    return resp.text or "Program loaded"
 
-    elif name == "set_config_item":
-        resp = await client.put(
-            f"/v1/configs/{args['category']}/{args['item']}",
-            params={"value": args["value"]}
-        )
-        resp.raise_for_status()
-        return resp.text or "Configuration updated"
 
-    elif name == "batch_set_config":
-        resp = await client.post("/v1/configs", json=args["settings"])
-        resp.raise_for_status()
-        return resp.text or "Configuration batch update complete"
+async def _h_run_prg_file(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/runners:run_prg", params={"file": args["file"]})
+    resp.raise_for_status()
+    return resp.text or "Program running"
 
-    elif name == "load_config_from_flash":
-        resp = await client.put("/v1/configs:load_from_flash")
-        resp.raise_for_status()
-        return resp.text or "Configuration loaded from flash"
 
-    elif name == "save_config_to_flash":
-        resp = await client.put("/v1/configs:save_to_flash")
-        resp.raise_for_status()
-        return resp.text or "Configuration saved to flash"
+async def _h_run_prg_upload(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    resp = await client.post("/v1/runners:run_prg", content=data, headers=headers)
+    resp.raise_for_status()
+    return resp.text or "Program running"
 
-    elif name == "reset_config_to_default":
-        resp = await client.put("/v1/configs:reset_to_default")
-        resp.raise_for_status()
-        return resp.text or "Configuration reset to defaults"
 
-    # Machine
-    elif name == "machine_reset":
-        resp = await client.put("/v1/machine:reset")
-        resp.raise_for_status()
-        return resp.text or "Machine reset"
+# Runners - CRT
+async def _h_run_crt_file(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/runners:run_crt", params={"file": args["file"]})
+    resp.raise_for_status()
+    return resp.text or "Cartridge started"
 
-    elif name == "machine_reboot":
-        resp = await client.put("/v1/machine:reboot")
-        resp.raise_for_status()
-        return resp.text or "Machine rebooting"
 
-    elif name == "machine_pause":
-        resp = await client.put("/v1/machine:pause")
-        resp.raise_for_status()
-        return resp.text or "Machine paused"
+async def _h_run_crt_upload(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    resp = await client.post("/v1/runners:run_crt", content=data, headers=headers)
+    resp.raise_for_status()
+    return resp.text or "Cartridge started"
 
-    elif name == "machine_resume":
-        resp = await client.put("/v1/machine:resume")
-        resp.raise_for_status()
-        return resp.text or "Machine resumed"
 
-    elif name == "machine_poweroff":
-        resp = await client.put("/v1/machine:poweroff")
-        resp.raise_for_status()
-        return resp.text or "Machine powered off"
+# Configuration
+async def _h_list_config_categories(client: httpx.AsyncClient, args: dict) -> str:
+    return await cached_get(client, "/v1/configs", CONFIG_CATEGORIES_CACHE_TTL)
 
-    elif name == "write_memory":
-        data = bytes.fromhex(args["data"])
-        resp = await client.post(
-            "/v1/machine:writemem",
-            params={"address": args["address"]},
-            content=data
-        )
-        resp.raise_for_status()
-        return resp.text or f"Wrote {len(data)} bytes to ${args['address']}"
 
-    elif name == "write_memory_binary":
-        data = decode_base64_data(args["data"])
-        resp = await client.post(
-            "/v1/machine:writemem",
-            params={"address": args["address"]},
-            content=data
-        )
-        resp.raise_for_status()
-        return resp.text or f"Wrote {len(data)} bytes to ${args['address']}"
+async def _h_get_config_category(client: httpx.AsyncClient, args: dict) -> str:
+    return await cached_get(client, f"/v1/configs/{args['category']}", CONFIG_CACHE_TTL)
 
-    elif name == "read_memory":
-        params = {"address": args["address"]}
-        if "length" in args:
-            params["length"] = args["length"]
-        resp = await client.get("/v1/machine:readmem", params=params)
-        resp.raise_for_status()
-        # Return as hex dump
-        data = resp.content
-        hex_str = data.hex()
-        return f"Read {len(data)} bytes from ${args['address']}: {hex_str}"
 
-    elif name == "read_debug_register":
-        resp = await client.get("/v1/machine:debugreg")
-        resp.raise_for_status()
-        return resp.text
+async def _h_get_config_item(client: httpx.AsyncClient, args: dict) -> str:
+    return await cached_get(client, f"/v1/configs/{args['category']}/{args['item']}", CONFIG_CACHE_TTL)
 
-    elif name == "write_debug_register":
-        resp = await client.put("/v1/machine:debugreg", params={"value": args["value"]})
-        resp.raise_for_status()
-        return resp.text or "Debug register written"
 
-    elif name == "capture_screen":
-        scale = args.get("scale", 4)
-        include_border = args.get("include_border", True)
-        return await capture_screen_logic(client, scale, include_border)
+async def _h_set_config_item(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(
+        f"/v1/configs/{args['category']}/{args['item']}",
+        params={"value": args["value"]}
+    )
+    invalidate_cache("/v1/configs", "/v1/drives")
+    resp.raise_for_status()
+    return resp.text or "Configuration updated"
 
-    elif name == "get_screen_mode":
-        mode_info = await detect_screen_mode_logic(client)
-        return json.dumps(mode_info, indent=2)
 
-    elif name == "capture_screen_with_mode":
-        mode_str = args["mode"]
-        try:
-            mode = ScreenMode(mode_str)
-        except ValueError:
-            return f"Invalid screen mode: {mode_str}. Valid modes: {[m.value for m in VALID_SCREEN_MODES]}"
-        scale = args.get("scale", 2)
-        include_border = args.get("include_border", True)
-        return await capture_screen_with_mode_logic(client, mode, scale, include_border)
-
-    elif name == "capture_all_screen_modes":
-        scale = args.get("scale", 2)
-        include_border = args.get("include_border", True)
-        return await capture_all_screen_modes_logic(client, scale, include_border)
-
-    elif name == "capture_screen_with_config":
-        mode_str = args["mode"]
-        try:
-            mode = ScreenMode(mode_str)
-        except ValueError:
-            return f"Invalid screen mode: {mode_str}. Valid modes: {[m.value for m in VALID_SCREEN_MODES]}"
+async def _h_batch_set_config(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.post("/v1/configs", json=args["settings"])
+    invalidate_cache("/v1/configs", "/v1/drives")
+    resp.raise_for_status()
+    return resp.text or "Configuration batch update complete"
 
-        # Parse hex addresses
-        try:
-            screen_addr = int(args["screen_addr"], 16)
-        except ValueError:
-            return f"Invalid screen address: {args['screen_addr']}. Must be hex (e.g., 0400, 0800)"
-
-        char_addr = None
-        if "char_addr" in args and args["char_addr"]:
-            try:
-                char_addr = int(args["char_addr"], 16)
-            except ValueError:
-                return f"Invalid char address: {args['char_addr']}. Must be hex (e.g., 1000, 1800)"
-
-        bitmap_addr = None
-        if "bitmap_addr" in args and args["bitmap_addr"]:
-            try:
-                bitmap_addr = int(args["bitmap_addr"], 16)
-            except ValueError:
-                return f"Invalid bitmap address: {args['bitmap_addr']}. Must be hex (e.g., 2000, 4000)"
-
-        scale = args.get("scale", 2)
-        include_border = args.get("include_border", True)
-        return await capture_screen_with_config_logic(
-            client, mode, screen_addr, char_addr, bitmap_addr, scale, include_border
-        )
 
-    elif name == "type_text":
-        text = args["text"]
-        wait_ms = args.get("wait_ms", 100)
-        return await type_text_logic(client, text, wait_ms)
+async def _h_load_config_from_flash(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/configs:load_from_flash")
+    invalidate_cache("/v1/configs", "/v1/drives")
+    resp.raise_for_status()
+    return resp.text or "Configuration loaded from flash"
 
-    elif name == "send_key":
-        key = args["key"]
-        return await send_key_logic(client, key)
 
-    elif name == "enter_basic_program":
-        program = args["program"]
-        auto_run = args.get("auto_run", False)
+async def _h_save_config_to_flash(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/configs:save_to_flash")
+    invalidate_cache("/v1/configs", "/v1/drives")
+    resp.raise_for_status()
+    return resp.text or "Configuration saved to flash"
 
-        try:
-            # Tokenize the BASIC program
-            program_bytes = basic_to_bytes(program)
-            end_addr = get_program_end_address(program_bytes, BASIC_START)
-        except ValueError as e:
-            return f"Error tokenizing program: {e}"
 
-        # Write program to memory at $0801
-        resp = await client.post(
-            "/v1/machine:writemem",
-            params={"address": f"{BASIC_START:04X}"},
-            content=program_bytes
-        )
-        resp.raise_for_status()
+async def _h_reset_config_to_default(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/configs:reset_to_default")
+    invalidate_cache("/v1/configs", "/v1/drives")
+    resp.raise_for_status()
+    return resp.text or "Configuration reset to defaults"
 
-        # Update BASIC pointers
-        # $2B-$2C: Start of BASIC (should already be $0801, but set it anyway)
-        # $2D-$2E: Start of variables (end of program)
-        # $2F-$30: Start of arrays (same as variables initially)
-        # $31-$32: End of arrays (same as variables initially)
-        # $33-$34: Bottom of strings (same as variables initially)
 
-        # Set start of BASIC ($2B-$2C) to $0801
-        resp = await client.post(
-            "/v1/machine:writemem",
-            params={"address": "2B"},
-            content=bytes([BASIC_START & 0xFF, (BASIC_START >> 8) & 0xFF])
-        )
-        resp.raise_for_status()
+# Machine
+async def _h_machine_reset(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/machine:reset")
+    resp.raise_for_status()
+    return resp.text or "Machine reset"
 
-        # Set start of variables ($2D-$2E) to end of program
-        resp = await client.post(
-            "/v1/machine:writemem",
-            params={"address": "2D"},
-            content=bytes([end_addr & 0xFF, (end_addr >> 8) & 0xFF])
-        )
-        resp.raise_for_status()
 
-        # Set start of arrays ($2F-$30) to end of program
-        resp = await client.post(
-            "/v1/machine:writemem",
-            params={"address": "2F"},
-            content=bytes([end_addr & 0xFF, (end_addr >> 8) & 0xFF])
-        )
-        resp.raise_for_status()
+async def _h_machine_reboot(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/machine:reboot")
+    # A reboot may also bring up newly flashed firmware with a different API version
+    invalidate_cache("/v1/configs", "/v1/drives", "/v1/version")
+    resp.raise_for_status()
+    return resp.text or "Machine rebooting"
 
-        # Set end of arrays ($31-$32) to end of program
-        resp = await client.post(
-            "/v1/machine:writemem",
-            params={"address": "31"},
-            content=bytes([end_addr & 0xFF, (end_addr >> 8) & 0xFF])
-        )
-        resp.raise_for_status()
 
-        result_msg = f"BASIC program entered: {len(program_bytes)} bytes at ${BASIC_START:04X}-${end_addr-1:04X}"
+async def _h_machine_pause(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(PAUSE_PATH)
+    resp.raise_for_status()
+    return resp.text or "Machine paused"
 
-        # Auto-run if requested
-        if auto_run:
-            # Type RUN and RETURN
-            await type_text_logic(client, "RUN{RETURN}", wait_ms=0)
-            result_msg += " - RUN command sent"
 
-        return result_msg
+async def _h_machine_resume(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(RESUME_PATH)
+    resp.raise_for_status()
+    return resp.text or "Machine resumed"
 
-    # Drives
-    elif name == "list_drives":
-        resp = await client.get("/v1/drives")
-        resp.raise_for_status()
-        return resp.text
-
-    elif name == "mount_disk_file":
-        params = {"image": args["image"]}
-        if "type" in args:
-            params["type"] = args["type"]
-        if "mode" in args:
-            params["mode"] = args["mode"]
-        resp = await client.put(f"/v1/drives/{args['drive']}:mount", params=params)
+
+async def _h_machine_poweroff(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/machine:poweroff")
+    invalidate_cache("/v1/configs", "/v1/drives")
+    resp.raise_for_status()
+    return resp.text or "Machine powered off"
+
+
+async def _h_write_memory(client: httpx.AsyncClient, args: dict) -> str:
+    # bytes.fromhex decodes in C and already skips whitespace between byte pairs
+    try:
+        data = bytes.fromhex(args["data"])
+    except ValueError:
+        return f"Invalid hex data: {args['data'][:32]}. Must be pairs of hex digits (e.g., A9008D2004)"
+    resp = await client.post(
+        WRITEMEM_PATH,
+        params={"address": args["address"]},
+        content=data
+    )
+    resp.raise_for_status()
+    return resp.text or f"Wrote {len(data)} bytes to ${args['address']}"
+
+
+async def _h_write_memory_binary(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    resp = await client.post(
+        WRITEMEM_PATH,
+        params={"address": args["address"]},
+        content=data,
+        headers=headers
+    )
+    resp.raise_for_status()
+    return resp.text or f"Wrote {headers['Content-Length']} bytes to ${args['address']}"
+
+
+async def _h_read_memory(client: httpx.AsyncClient, args: dict) -> str:
+    params = {"address": args["address"]}
+    if "length" in args:
+        params["length"] = args["length"]
+    resp = await client.get(READMEM_PATH, params=params)
+    resp.raise_for_status()
+    # Return as hex dump
+    data = resp.content
+    hex_str = data.hex()
+    return f"Read {len(data)} bytes from ${args['address']}: {hex_str}"
+
+
+async def _h_batch_read_memory(client: httpx.AsyncClient, args: dict) -> str:
+    async def read_range(item):
+        params = {"address": item["address"]}
+        if "length" in item:
+            params["length"] = item["length"]
+        resp = await client.get(READMEM_PATH, params=params)
         resp.raise_for_status()
-        return resp.text or f"Disk mounted on drive {args['drive']}"
-
-    elif name == "mount_disk_upload":
-        data = decode_base64_data(args["data"])
-        params = {}
-        if "type" in args:
-            params["type"] = args["type"]
-        if "mode" in args:
-            params["mode"] = args["mode"]
+        data = resp.content
+        return f"Read {len(data)} bytes from ${item['address']}: {data.hex()}"
+
+    # The device has no multi-range endpoint, so issue the reads concurrently.
+    # If one fails, cancel the rest rather than leave them holding the pool
+    tasks = [asyncio.ensure_future(read_range(item)) for item in args["ranges"]]
+    try:
+        lines = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return "\n".join(lines)
+
+
+async def _h_batch_write_memory(client: httpx.AsyncClient, args: dict) -> str:
+    # Decode everything up front so a bad entry fails before any write is sent
+    writes = []
+    for index, item in enumerate(args["writes"]):
+        try:
+            writes.append((item["address"], bytes.fromhex(item["data"])))
+        except ValueError:
+            return (
+                f"Invalid hex data in writes[{index}] (${item['address']}): {item['data'][:32]}. "
+                "Must be pairs of hex digits (e.g., A9008D2004)"
+            )
+
+    # Writes go out one at a time in list order, so overlapping or dependent
+    # entries apply as listed and a failure leaves exactly the earlier ones done
+    lines = []
+    for address, data in writes:
         resp = await client.post(
-            f"/v1/drives/{args['drive']}:mount",
-            params=params,
+            WRITEMEM_PATH,
+            params={"address": address},
             content=data
         )
         resp.raise_for_status()
-        return resp.text or f"Disk uploaded and mounted on drive {args['drive']}"
+        lines.append(f"Wrote {len(data)} bytes to ${address}")
+    return "\n".join(lines)
 
-    elif name == "drive_reset":
-        resp = await client.put(f"/v1/drives/{args['drive']}:reset")
-        resp.raise_for_status()
-        return resp.text or f"Drive {args['drive']} reset"
 
-    elif name == "drive_remove":
-        resp = await client.put(f"/v1/drives/{args['drive']}:remove")
-        resp.raise_for_status()
-        return resp.text or f"Disk removed from drive {args['drive']}"
+async def _h_read_debug_register(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.get("/v1/machine:debugreg")
+    resp.raise_for_status()
+    return resp.text
 
-    elif name == "drive_on":
-        resp = await client.put(f"/v1/drives/{args['drive']}:on")
-        resp.raise_for_status()
-        return resp.text or f"Drive {args['drive']} enabled"
 
-    elif name == "drive_off":
-        resp = await client.put(f"/v1/drives/{args['drive']}:off")
-        resp.raise_for_status()
-        return resp.text or f"Drive {args['drive']} disabled"
+async def _h_write_debug_register(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put("/v1/machine:debugreg", params={"value": args["value"]})
+    resp.raise_for_status()
+    return resp.text or "Debug register written"
 
-    elif name == "drive_load_rom_file":
-        resp = await client.put(
-            f"/v1/drives/{args['drive']}:load_rom",
-            params={"file": args["file"]}
-        )
-        resp.raise_for_status()
-        return resp.text or f"ROM loaded for drive {args['drive']}"
 
-    elif name == "drive_load_rom_upload":
-        data = decode_base64_data(args["data"])
-        resp = await client.post(
-            f"/v1/drives/{args['drive']}:load_rom",
-            content=data
-        )
-        resp.raise_for_status()
-        return resp.text or f"ROM uploaded and loaded for drive {args['drive']}"
+async def _h_capture_screen(client: httpx.AsyncClient, args: dict) -> ScreenImage:
+    scale = args.get("scale", 4)
+    include_border = args.get("include_border", True)
+    return await capture_screen_logic(client, scale, include_border)
 
-    elif name == "drive_set_mode":
-        resp = await client.put(
-            f"/v1/drives/{args['drive']}:set_mode",
-            params={"mode": args["mode"]}
-        )
-        resp.raise_for_status()
-        return resp.text or f"Drive {args['drive']} mode set to {args['mode']}"
 
-    # Streams
-    elif name == "stream_start":
-        resp = await client.put(
-            f"/v1/streams/{args['stream']}:start",
-            params={"ip": args["ip"]}
-        )
-        resp.raise_for_status()
-        return resp.text or f"Stream {args['stream']} started to {args['ip']}"
+async def _h_get_screen_mode(client: httpx.AsyncClient, args: dict) -> str:
+    mode_info = await detect_screen_mode_logic(client)
+    return json.dumps(mode_info, indent=2)
 
-    elif name == "stream_stop":
-        resp = await client.put(f"/v1/streams/{args['stream']}:stop")
-        resp.raise_for_status()
-        return resp.text or f"Stream {args['stream']} stopped"
 
-    # Files
-    elif name == "get_file_info":
-        resp = await client.get(f"/v1/files/{args['path']}:info")
-        resp.raise_for_status()
-        return resp.text
-
-    elif name == "create_d64":
-        params = {}
-        if "tracks" in args:
-            params["tracks"] = args["tracks"]
-        if "diskname" in args:
-            params["diskname"] = args["diskname"]
-        resp = await client.put(f"/v1/files/{args['path']}:create_d64", params=params)
-        resp.raise_for_status()
-        return resp.text or f"D64 image created at {args['path']}"
+async def _h_capture_screen_with_mode(client: httpx.AsyncClient, args: dict) -> ScreenImage | str:
+    mode_str = args["mode"]
+    try:
+        mode = ScreenMode(mode_str)
+    except ValueError:
+        return f"Invalid screen mode: {mode_str}. Valid modes: {_SCREEN_MODES_TEXT}"
+    scale = args.get("scale", 2)
+    include_border = args.get("include_border", True)
+    return await capture_screen_with_mode_logic(client, mode, scale, include_border)
 
-    elif name == "create_d71":
-        params = {}
-        if "diskname" in args:
-            params["diskname"] = args["diskname"]
-        resp = await client.put(f"/v1/files/{args['path']}:create_d71", params=params)
-        resp.raise_for_status()
-        return resp.text or f"D71 image created at {args['path']}"
 
-    elif name == "create_d81":
-        params = {}
-        if "diskname" in args:
-            params["diskname"] = args["diskname"]
-        resp = await client.put(f"/v1/files/{args['path']}:create_d81", params=params)
-        resp.raise_for_status()
-        return resp.text or f"D81 image created at {args['path']}"
+async def _h_capture_all_screen_modes(client: httpx.AsyncClient, args: dict) -> list[ScreenImage]:
+    scale = args.get("scale", 2)
+    include_border = args.get("include_border", True)
+    return await capture_all_screen_modes_logic(client, scale, include_border)
 
-    elif name == "create_dnp":
-        params = {"tracks": args["tracks"]}
-        if "diskname" in args:
-            params["diskname"] = args["diskname"]
-        resp = await client.put(f"/v1/files/{args['path']}:create_dnp", params=params)
-        resp.raise_for_status()
-        return resp.text or f"DNP image created at {args['path']}"
 
-    else:
+async def _h_capture_screen_with_config(client: httpx.AsyncClient, args: dict) -> ScreenImage | str:
+    mode_str = args["mode"]
+    try:
+        mode = ScreenMode(mode_str)
+    except ValueError:
+        return f"Invalid screen mode: {mode_str}. Valid modes: {_SCREEN_MODES_TEXT}"
+
+    # Parse hex addresses
+    try:
+        screen_addr = int(args["screen_addr"], 16)
+    except ValueError:
+        return f"Invalid screen address: {args['screen_addr']}. Must be hex (e.g., 0400, 0800)"
+
+    char_addr = None
+    if "char_addr" in args and args["char_addr"]:
+        try:
+            char_addr = int(args["char_addr"], 16)
+        except ValueError:
+            return f"Invalid char address: {args['char_addr']}. Must be hex (e.g., 1000, 1800)"
+
+    bitmap_addr = None
+    if "bitmap_addr" in args and args["bitmap_addr"]:
+        try:
+            bitmap_addr = int(args["bitmap_addr"], 16)
+        except ValueError:
+            return f"Invalid bitmap address: {args['bitmap_addr']}. Must be hex (e.g., 2000, 4000)"
+
+    scale = args.get("scale", 2)
+    include_border = args.get("include_border", True)
+    return await capture_screen_with_config_logic(
+        client, mode, screen_addr, char_addr, bitmap_addr, scale, include_border
+    )
+
+
+async def _h_type_text(client: httpx.AsyncClient, args: dict) -> str:
+    text = args["text"]
+    wait_ms = args.get("wait_ms", 100)
+    return await type_text_logic(client, text, wait_ms)
+
+
+async def _h_send_key(client: httpx.AsyncClient, args: dict) -> str:
+    key = args["key"]
+    return await send_key_logic(client, key)
+
+
+async def _h_enter_basic_program(client: httpx.AsyncClient, args: dict) -> str:
+    program = args["program"]
+    auto_run = args.get("auto_run", False)
+
+    try:
+        # Tokenize the BASIC program. Larger programs are tokenized in a
+        # worker thread so other tool calls are not stalled meanwhile
+        if len(program) < _INLINE_TOKENIZE_LIMIT:
+            program_bytes = basic_to_bytes(program)
+        else:
+            program_bytes = await asyncio.to_thread(basic_to_bytes, program)
+        end_addr = get_program_end_address(program_bytes, BASIC_START)
+    except ValueError as e:
+        return f"Error tokenizing program: {e}"
+
+    # Write program to memory at $0801
+    resp = await client.post(
+        WRITEMEM_PATH,
+        params={"address": f"{BASIC_START:04X}"},
+        content=program_bytes
+    )
+    resp.raise_for_status()
+
+    # Update BASIC pointers
+    # $2B-$2C: Start of BASIC (should already be $0801, but set it anyway)
+    # $2D-$2E: Start of variables (end of program)
+    # $2F-$30: Start of arrays (same as variables initially)
+    # $31-$32: End of arrays (same as variables initially)
+    # $33-$34: Bottom of strings (same as variables initially)
+
+    # The four pointers are contiguous, so write them in a single request
+    resp = await client.post(
+        WRITEMEM_PATH,
+        params={"address": "2B"},
+        content=_BASIC_POINTERS.pack(BASIC_START, end_addr, end_addr, end_addr)
+    )
+    resp.raise_for_status()
+
+    result_msg = f"BASIC program entered: {len(program_bytes)} bytes at ${BASIC_START:04X}-${end_addr-1:04X}"
+
+    # Auto-run if requested
+    if auto_run:
+        # Type RUN and RETURN
+        await type_text_logic(client, "RUN{RETURN}", wait_ms=0)
+        result_msg += " - RUN command sent"
+
+    return result_msg
+
+
+# Drives
+async def _h_list_drives(client: httpx.AsyncClient, args: dict) -> str:
+    return await cached_get(client, "/v1/drives", DRIVES_CACHE_TTL)
+
+
+async def _h_mount_disk_file(client: httpx.AsyncClient, args: dict) -> str:
+    params = {"image": args["image"]}
+    if "type" in args:
+        params["type"] = args["type"]
+    if "mode" in args:
+        params["mode"] = args["mode"]
+    resp = await client.put(f"/v1/drives/{args['drive']}:mount", params=params)
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"Disk mounted on drive {args['drive']}"
+
+
+async def _h_mount_disk_upload(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    params = {}
+    if "type" in args:
+        params["type"] = args["type"]
+    if "mode" in args:
+        params["mode"] = args["mode"]
+    resp = await client.post(
+        f"/v1/drives/{args['drive']}:mount",
+        params=params,
+        content=data,
+        headers=headers
+    )
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"Disk uploaded and mounted on drive {args['drive']}"
+
+
+async def _h_drive_reset(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(f"/v1/drives/{args['drive']}:reset")
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"Drive {args['drive']} reset"
+
+
+async def _h_drive_remove(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(f"/v1/drives/{args['drive']}:remove")
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"Disk removed from drive {args['drive']}"
+
+
+async def _h_drive_on(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(f"/v1/drives/{args['drive']}:on")
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"Drive {args['drive']} enabled"
+
+
+async def _h_drive_off(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(f"/v1/drives/{args['drive']}:off")
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"Drive {args['drive']} disabled"
+
+
+async def _h_drive_load_rom_file(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(
+        f"/v1/drives/{args['drive']}:load_rom",
+        params={"file": args["file"]}
+    )
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"ROM loaded for drive {args['drive']}"
+
+
+async def _h_drive_load_rom_upload(client: httpx.AsyncClient, args: dict) -> str:
+    data, headers = base64_upload(args["data"])
+    resp = await client.post(
+        f"/v1/drives/{args['drive']}:load_rom",
+        content=data,
+        headers=headers
+    )
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"ROM uploaded and loaded for drive {args['drive']}"
+
+
+async def _h_drive_set_mode(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(
+        f"/v1/drives/{args['drive']}:set_mode",
+        params={"mode": args["mode"]}
+    )
+    invalidate_cache("/v1/drives")
+    resp.raise_for_status()
+    return resp.text or f"Drive {args['drive']} mode set to {args['mode']}"
+
+
+# Streams
+async def _h_stream_start(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(
+        f"/v1/streams/{args['stream']}:start",
+        params={"ip": args["ip"]}
+    )
+    resp.raise_for_status()
+    return resp.text or f"Stream {args['stream']} started to {args['ip']}"
+
+
+async def _h_stream_stop(client: httpx.AsyncClient, args: dict) -> str:
+    resp = await client.put(f"/v1/streams/{args['stream']}:stop")
+    resp.raise_for_status()
+    return resp.text or f"Stream {args['stream']} stopped"
+
+
+# Files
+async def _h_get_file_info(client: httpx.AsyncClient, args: dict) -> str:
+    return await cached_get(client, f"/v1/files/{args['path']}:info", FILE_INFO_CACHE_TTL)
+
+
+async def _h_create_d64(client: httpx.AsyncClient, args: dict) -> str:
+    params = {}
+    if "tracks" in args:
+        params["tracks"] = args["tracks"]
+    if "diskname" in args:
+        params["diskname"] = args["diskname"]
+    resp = await client.put(f"/v1/files/{args['path']}:create_d64", params=params)
+    invalidate_cache("/v1/files")
+    resp.raise_for_status()
+    return resp.text or f"D64 image created at {args['path']}"
+
+
+async def _h_create_d71(client: httpx.AsyncClient, args: dict) -> str:
+    params = {}
+    if "diskname" in args:
+        params["diskname"] = args["diskname"]
+    resp = await client.put(f"/v1/files/{args['path']}:create_d71", params=params)
+    invalidate_cache("/v1/files")
+    resp.raise_for_status()
+    return resp.text or f"D71 image created at {args['path']}"
+
+
+async def _h_create_d81(client: httpx.AsyncClient, args: dict) -> str:
+    params = {}
+    if "diskname" in args:
+        params["diskname"] = args["diskname"]
+    resp = await client.put(f"/v1/files/{args['path']}:create_d81", params=params)
+    invalidate_cache("/v1/files")
+    resp.raise_for_status()
+    return resp.text or f"D81 image created at {args['path']}"
+
+
+async def _h_create_dnp(client: httpx.AsyncClient, args: dict) -> str:
+    params = {"tracks": args["tracks"]}
+    if "diskname" in args:
+        params["diskname"] = args["diskname"]
+    resp = await client.put(f"/v1/files/{args['path']}:create_dnp", params=params)
+    invalidate_cache("/v1/files")
+    resp.raise_for_status()
+    return resp.text or f"DNP image created at {args['path']}"
+
+
+# Tool name -> handler, built once at import
+_DISPATCH: dict[str, Callable[[httpx.AsyncClient, dict], Awaitable[ToolResult]]] = {
+    "get_version": _h_get_version,
+    "sidplay_file": _h_sidplay_file,
+    "sidplay_upload": _h_sidplay_upload,
+    "modplay_file": _h_modplay_file,
+    "modplay_upload": _h_modplay_upload,
+    "load_prg_file": _h_load_prg_file,
+    "load_prg_upload": _h_load_prg_upload,
+    "run_prg_file": _h_run_prg_file,
+    "run_prg_upload": _h_run_prg_upload,
+    "run_crt_file": _h_run_crt_file,
+    "run_crt_upload": _h_run_crt_upload,
+    "list_config_categories": _h_list_config_categories,
+    "get_config_category": _h_get_config_category,
+    "get_config_item": _h_get_config_item,
+    "set_config_item": _h_set_config_item,
+    "batch_set_config": _h_batch_set_config,
+    "load_config_from_flash": _h_load_config_from_flash,
+    "save_config_to_flash": _h_save_config_to_flash,
+    "reset_config_to_default": _h_reset_config_to_default,
+    "machine_reset": _h_machine_reset,
+    "machine_reboot": _h_machine_reboot,
+    "machine_pause": _h_machine_pause,
+    "machine_resume": _h_machine_resume,
+    "machine_poweroff": _h_machine_poweroff,
+    "write_memory": _h_write_memory,
+    "write_memory_binary": _h_write_memory_binary,
+    "read_memory": _h_read_memory,
+    "batch_read_memory": _h_batch_read_memory,
+    "batch_write_memory": _h_batch_write_memory,
+    "read_debug_register": _h_read_debug_register,
+    "write_debug_register": _h_write_debug_register,
+    "capture_screen": _h_capture_screen,
+    "get_screen_mode": _h_get_screen_mode,
+    "capture_screen_with_mode": _h_capture_screen_with_mode,
+    "capture_all_screen_modes": _h_capture_all_screen_modes,
+    "capture_screen_with_config": _h_capture_screen_with_config,
+    "type_text": _h_type_text,
+    "send_key": _h_send_key,
+    "enter_basic_program": _h_enter_basic_program,
+    "list_drives": _h_list_drives,
+    "mount_disk_file": _h_mount_disk_file,
+    "mount_disk_upload": _h_mount_disk_upload,
+    "drive_reset": _h_drive_reset,
+    "drive_remove": _h_drive_remove,
+    "drive_on": _h_drive_on,
+    "drive_off": _h_drive_off,
+    "drive_load_rom_file": _h_drive_load_rom_file,
+    "drive_load_rom_upload": _h_drive_load_rom_upload,
+    "drive_set_mode": _h_drive_set_mode,
+    "stream_start": _h_stream_start,
+    "stream_stop": _h_stream_stop,
+    "get_file_info": _h_get_file_info,
+    "create_d64": _h_create_d64,
+    "create_d71": _h_create_d71,
+    "create_d81": _h_create_d81,
+    "create_dnp": _h_create_dnp,
+}
+
+
+async def _handle_tool(client: httpx.AsyncClient, name: str, args: dict) -> ToolResult:
+    """Route tool calls to appropriate handlers."""
+    handler = _DISPATCH.get(name)
+    if handler is None:
         return f"Unknown tool: {name}"
+    return await handler(client, args)
 
 
 # ============================================================================
@@ -1250,12 +1651,30 @@ async def _handle_tool(client: httpx.AsyncClient, name: str, args: dict) -> str:
 async def main():
     """Run the MCP server."""
     async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+        try:
+            # Create the shared client on the server loop up front; building
+            # the transport (including its SSL context) takes tens of
+            # milliseconds that would otherwise land on the first tool call
+            await get_client()
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+        finally:
+            await close_client()
+
+
+def _loop_factory():
+    """Return uvloop's event loop factory if it is installed and not disabled with C64U_UVLOOP=0."""
+    if os.environ.get("C64U_UVLOOP") == "0":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=_loop_factory())
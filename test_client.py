@@ -48,6 +48,7 @@ PREDEFINED_PARAMS = {
     "list_drives": {},
     "list_config_categories": {},
     "read_memory": {"address": "0400", "length": 256},
+    "batch_read_memory": {"ranges": [{"address": "0400", "length": 40}, {"address": "D800", "length": 40}]},
     "read_debug_register": {},
     "type_text": {"text": "HELLO WORLD{RETURN}", "wait_ms": 100},
     "send_key": {"key": "RETURN"},
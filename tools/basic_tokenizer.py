@@ -105,9 +105,44 @@ BASIC_TOKENS = {
 # Reverse mapping: token byte -> keyword (for debugging/listing)
 TOKEN_TO_KEYWORD = {v: k for k, v in BASIC_TOKENS.items()}
 
-# Keywords sorted by length (longest first) for proper tokenization
-# This ensures "PRINT#" is matched before "PRINT", "INPUT#" before "INPUT", etc.
-SORTED_KEYWORDS = sorted(BASIC_TOKENS.keys(), key=len, reverse=True)
+
+def _build_keyword_trie(keywords) -> dict:
+    """
+    Build a character trie of BASIC keywords.
+
+    Each node maps the next character to a child node; the key None holds
+    the complete keyword ending at that node.
+    """
+    root = {}
+    for keyword in keywords:
+        node = root
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[None] = keyword
+    return root
+
+
+# Keyword trie, so matching at a position walks the line once instead of
+# comparing against every keyword
+KEYWORD_TRIE = _build_keyword_trie(BASIC_TOKENS)
+
+
+def _match_keywords(upper_line: str, pos: int) -> list[str]:
+    """
+    Return all keywords that start at pos in upper_line, longest first.
+
+    Longest first ensures "PRINT#" is tried before "PRINT", "INPUT#" before "INPUT", etc.
+    """
+    matches = []
+    node = KEYWORD_TRIE
+    for i in range(pos, len(upper_line)):
+        node = node.get(upper_line[i])
+        if node is None:
+            break
+        if None in node:
+            matches.append(node[None])
+    matches.reverse()
+    return matches
 
 # Operators that should NOT be tokenized (kept as single-byte ASCII)
 # Note: The C64 does tokenize operators, but we need to be careful with context
@@ -164,36 +199,35 @@ def tokenize_line(line_text: str) -> bytes:
 
         # Try to match keywords (longest first)
         matched = False
-        for keyword in SORTED_KEYWORDS:
-            if upper_line[i:i + len(keyword)] == keyword:
-                # Check if this is a valid keyword boundary
-                # (not part of a variable name like "FOREST" containing "FOR")
-                if len(keyword) > 1 and keyword not in ALWAYS_TOKENIZE_OPS:
-                    # Check if next character would make this part of a variable name
-                    next_pos = i + len(keyword)
-                    if next_pos < len(line_text):
-                        next_char = upper_line[next_pos]
-                        # If followed by alphanumeric, it's a variable name, not keyword
-                        if next_char.isalnum() or next_char == '$' or next_char == '%':
-                            # Exception: keywords ending with ( or $ are always tokenized
-                            if not (keyword.endswith('(') or keyword.endswith('$')):
-                                continue
-
-                    # Check if preceded by alphanumeric (part of variable name)
-                    if i > 0:
-                        prev_char = upper_line[i - 1]
-                        if prev_char.isalnum() or prev_char == '$' or prev_char == '%':
+        for keyword in _match_keywords(upper_line, i):
+            # Check if this is a valid keyword boundary
+            # (not part of a variable name like "FOREST" containing "FOR")
+            if len(keyword) > 1 and keyword not in ALWAYS_TOKENIZE_OPS:
+                # Check if next character would make this part of a variable name
+                next_pos = i + len(keyword)
+                if next_pos < len(line_text):
+                    next_char = upper_line[next_pos]
+                    # If followed by alphanumeric, it's a variable name, not keyword
+                    if next_char.isalnum() or next_char == '$' or next_char == '%':
+                        # Exception: keywords ending with ( or $ are always tokenized
+                        if not (keyword.endswith('(') or keyword.endswith('$')):
                             continue
 
-                result.append(BASIC_TOKENS[keyword])
-                i += len(keyword)
-                matched = True
+                # Check if preceded by alphanumeric (part of variable name)
+                if i > 0:
+                    prev_char = upper_line[i - 1]
+                    if prev_char.isalnum() or prev_char == '$' or prev_char == '%':
+                        continue
+
+            result.append(BASIC_TOKENS[keyword])
+            i += len(keyword)
+            matched = True
 
-                # After REM, everything is comment (not tokenized)
-                if keyword == "REM":
-                    in_rem = True
+            # After REM, everything is comment (not tokenized)
+            if keyword == "REM":
+                in_rem = True
 
-                break
+            break
 
         if matched:
             continue
@@ -18,276 +18,283 @@ C64_PALETTE = [
     (159, 159, 159),  # 15: Light Gray
 ]
 
+# Flat 48-byte RGB form of C64_PALETTE, usable directly as an image palette
+C64_PALETTE_BYTES = bytes(c for rgb in C64_PALETTE for c in rgb)
+
 # C64 uppercase/graphics character set (2048 bytes, 256 chars x 8 bytes each)
 # This is the standard C64 character ROM (uppercase + graphics)
-C64_CHARSET = bytes([
+C64_CHARSET = bytes.fromhex(
     # Characters 0-31 (@ A-Z [ \ ] ^ _ and graphics)
-    0x3c,0x66,0x6e,0x6e,0x60,0x62,0x3c,0x00,  # @
-    0x18,0x3c,0x66,0x7e,0x66,0x66,0x66,0x00,  # A
-    0x7c,0x66,0x66,0x7c,0x66,0x66,0x7c,0x00,  # B
-    0x3c,0x66,0x60,0x60,0x60,0x66,0x3c,0x00,  # C
-    0x78,0x6c,0x66,0x66,0x66,0x6c,0x78,0x00,  # D
-    0x7e,0x60,0x60,0x78,0x60,0x60,0x7e,0x00,  # E
-    0x7e,0x60,0x60,0x78,0x60,0x60,0x60,0x00,  # F
-    0x3c,0x66,0x60,0x6e,0x66,0x66,0x3c,0x00,  # G
-    0x66,0x66,0x66,0x7e,0x66,0x66,0x66,0x00,  # H
-    0x3c,0x18,0x18,0x18,0x18,0x18,0x3c,0x00,  # I
-    0x1e,0x0c,0x0c,0x0c,0x0c,0x6c,0x38,0x00,  # J
-    0x66,0x6c,0x78,0x70,0x78,0x6c,0x66,0x00,  # K
-    0x60,0x60,0x60,0x60,0x60,0x60,0x7e,0x00,  # L
-    0x63,0x77,0x7f,0x6b,0x63,0x63,0x63,0x00,  # M
-    0x66,0x76,0x7e,0x7e,0x6e,0x66,0x66,0x00,  # N
-    0x3c,0x66,0x66,0x66,0x66,0x66,0x3c,0x00,  # O
-    0x7c,0x66,0x66,0x7c,0x60,0x60,0x60,0x00,  # P
-    0x3c,0x66,0x66,0x66,0x66,0x3c,0x0e,0x00,  # Q
-    0x7c,0x66,0x66,0x7c,0x78,0x6c,0x66,0x00,  # R
-    0x3c,0x66,0x60,0x3c,0x06,0x66,0x3c,0x00,  # S
-    0x7e,0x18,0x18,0x18,0x18,0x18,0x18,0x00,  # T
-    0x66,0x66,0x66,0x66,0x66,0x66,0x3c,0x00,  # U
-    0x66,0x66,0x66,0x66,0x66,0x3c,0x18,0x00,  # V
-    0x63,0x63,0x63,0x6b,0x7f,0x77,0x63,0x00,  # W
-    0x66,0x66,0x3c,0x18,0x3c,0x66,0x66,0x00,  # X
-    0x66,0x66,0x66,0x3c,0x18,0x18,0x18,0x00,  # Y
-    0x7e,0x06,0x0c,0x18,0x30,0x60,0x7e,0x00,  # Z
-    0x3c,0x30,0x30,0x30,0x30,0x30,0x3c,0x00,  # [
-    0x0c,0x12,0x30,0x7c,0x30,0x62,0xfc,0x00,  # pound
-    0x3c,0x0c,0x0c,0x0c,0x0c,0x0c,0x3c,0x00,  # ]
-    0x00,0x18,0x3c,0x7e,0x18,0x18,0x18,0x18,  # up arrow
-    0x00,0x10,0x30,0x7f,0x7f,0x30,0x10,0x00,  # left arrow
+    "3c666e6e60623c00"  # @
+    "183c667e66666600"  # A
+    "7c66667c66667c00"  # B
+    "3c66606060663c00"  # C
+    "786c6666666c7800"  # D
+    "7e60607860607e00"  # E
+    "7e60607860606000"  # F
+    "3c66606e66663c00"  # G
+    "6666667e66666600"  # H
+    "3c18181818183c00"  # I
+    "1e0c0c0c0c6c3800"  # J
+    "666c7870786c6600"  # K
+    "6060606060607e00"  # L
+    "63777f6b63636300"  # M
+    "66767e7e6e666600"  # N
+    "3c66666666663c00"  # O
+    "7c66667c60606000"  # P
+    "3c666666663c0e00"  # Q
+    "7c66667c786c6600"  # R
+    "3c66603c06663c00"  # S
+    "7e18181818181800"  # T
+    "6666666666663c00"  # U
+    "66666666663c1800"  # V
+    "6363636b7f776300"  # W
+    "66663c183c666600"  # X
+    "6666663c18181800"  # Y
+    "7e060c1830607e00"  # Z
+    "3c30303030303c00"  # [
+    "0c12307c3062fc00"  # pound
+    "3c0c0c0c0c0c3c00"  # ]
+    "00183c7e18181818"  # up arrow
+    "0010307f7f301000"  # left arrow
     # Characters 32-63 (space, !"#$%&'()*+,-./0-9:;<=>?)
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  # space
-    0x18,0x18,0x18,0x18,0x00,0x00,0x18,0x00,  # !
-    0x66,0x66,0x66,0x00,0x00,0x00,0x00,0x00,  # "
-    0x66,0x66,0xff,0x66,0xff,0x66,0x66,0x00,  # #
-    0x18,0x3e,0x60,0x3c,0x06,0x7c,0x18,0x00,  # $
-    0x62,0x66,0x0c,0x18,0x30,0x66,0x46,0x00,  # %
-    0x3c,0x66,0x3c,0x38,0x67,0x66,0x3f,0x00,  # &
-    0x06,0x0c,0x18,0x00,0x00,0x00,0x00,0x00,  # '
-    0x0c,0x18,0x30,0x30,0x30,0x18,0x0c,0x00,  # (
-    0x30,0x18,0x0c,0x0c,0x0c,0x18,0x30,0x00,  # )
-    0x00,0x66,0x3c,0xff,0x3c,0x66,0x00,0x00,  # *
-    0x00,0x18,0x18,0x7e,0x18,0x18,0x00,0x00,  # +
-    0x00,0x00,0x00,0x00,0x00,0x18,0x18,0x30,  # ,
-    0x00,0x00,0x00,0x7e,0x00,0x00,0x00,0x00,  # -
-    0x00,0x00,0x00,0x00,0x00,0x18,0x18,0x00,  # .
-    0x00,0x03,0x06,0x0c,0x18,0x30,0x60,0x00,  # /
-    0x3c,0x66,0x6e,0x76,0x66,0x66,0x3c,0x00,  # 0
-    0x18,0x18,0x38,0x18,0x18,0x18,0x7e,0x00,  # 1
-    0x3c,0x66,0x06,0x0c,0x30,0x60,0x7e,0x00,  # 2
-    0x3c,0x66,0x06,0x1c,0x06,0x66,0x3c,0x00,  # 3
-    0x06,0x0e,0x1e,0x66,0x7f,0x06,0x06,0x00,  # 4
-    0x7e,0x60,0x7c,0x06,0x06,0x66,0x3c,0x00,  # 5
-    0x3c,0x66,0x60,0x7c,0x66,0x66,0x3c,0x00,  # 6
-    0x7e,0x66,0x0c,0x18,0x18,0x18,0x18,0x00,  # 7
-    0x3c,0x66,0x66,0x3c,0x66,0x66,0x3c,0x00,  # 8
-    0x3c,0x66,0x66,0x3e,0x06,0x66,0x3c,0x00,  # 9
-    0x00,0x00,0x18,0x00,0x00,0x18,0x00,0x00,  # :
-    0x00,0x00,0x18,0x00,0x00,0x18,0x18,0x30,  # ;
-    0x0e,0x18,0x30,0x60,0x30,0x18,0x0e,0x00,  # <
-    0x00,0x00,0x7e,0x00,0x7e,0x00,0x00,0x00,  # =
-    0x70,0x18,0x0c,0x06,0x0c,0x18,0x70,0x00,  # >
-    0x3c,0x66,0x06,0x0c,0x18,0x00,0x18,0x00,  # ?
+    "0000000000000000"  # space
+    "1818181800001800"  # !
+    "6666660000000000"  # "
+    "6666ff66ff666600"  # #
+    "183e603c067c1800"  # $
+    "62660c1830664600"  # %
+    "3c663c3867663f00"  # &
+    "060c180000000000"  # '
+    "0c18303030180c00"  # (
+    "30180c0c0c183000"  # )
+    "00663cff3c660000"  # *
+    "0018187e18180000"  # +
+    "0000000000181830"  # ,
+    "0000007e00000000"  # -
+    "0000000000181800"  # .
+    "0003060c18306000"  # /
+    "3c666e7666663c00"  # 0
+    "1818381818187e00"  # 1
+    "3c66060c30607e00"  # 2
+    "3c66061c06663c00"  # 3
+    "060e1e667f060600"  # 4
+    "7e607c0606663c00"  # 5
+    "3c66607c66663c00"  # 6
+    "7e660c1818181800"  # 7
+    "3c66663c66663c00"  # 8
+    "3c66663e06663c00"  # 9
+    "0000180000180000"  # :
+    "0000180000181830"  # ;
+    "0e18306030180e00"  # <
+    "00007e007e000000"  # =
+    "70180c060c187000"  # >
+    "3c66060c18001800"  # ?
     # Characters 64-95 (graphics characters)
-    0x00,0x00,0x00,0xff,0xff,0x00,0x00,0x00,  # horiz line
-    0x36,0x7f,0x7f,0x7f,0x3e,0x1c,0x08,0x00,  # spade
-    0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,  # vert line
-    0x00,0x00,0x00,0xff,0xff,0x18,0x18,0x18,  # T up
-    0x18,0x18,0x18,0xff,0xff,0x00,0x00,0x00,  # T down
-    0x18,0x18,0x18,0xf8,0xf8,0x18,0x18,0x18,  # T left
-    0x00,0x00,0x03,0x3e,0x76,0x36,0x36,0x00,  # curve TR
-    0x00,0x00,0xc0,0x7c,0x6e,0x6c,0x6c,0x00,  # curve TL
-    0x36,0x36,0x76,0x3e,0x03,0x00,0x00,0x00,  # curve BR
-    0x6c,0x6c,0x6e,0x7c,0xc0,0x00,0x00,0x00,  # curve BL
-    0x18,0x18,0x18,0x1f,0x1f,0x18,0x18,0x18,  # T right
-    0x00,0x00,0x00,0x1f,0x1f,0x18,0x18,0x18,  # corner TL
-    0x18,0x18,0x18,0x1f,0x1f,0x00,0x00,0x00,  # corner BL
-    0x18,0x18,0x18,0xf8,0xf8,0x00,0x00,0x00,  # corner BR
-    0x00,0x00,0x00,0xf8,0xf8,0x18,0x18,0x18,  # corner TR
-    0x18,0x18,0x18,0xff,0xff,0x18,0x18,0x18,  # cross
-    0x00,0x00,0x00,0x0f,0x0f,0x0f,0x0f,0x00,  # block BR
-    0x00,0x00,0x00,0xf0,0xf0,0xf0,0xf0,0x00,  # block BL
-    0x0f,0x0f,0x0f,0x0f,0x00,0x00,0x00,0x00,  # block TR
-    0x08,0x1c,0x3e,0x7f,0x7f,0x1c,0x3e,0x00,  # club
-    0xf0,0xf0,0xf0,0xf0,0x00,0x00,0x00,0x00,  # block TL
-    0x80,0xc0,0xe0,0xf0,0xe0,0xc0,0x80,0x00,  # triangle left
-    0xff,0xff,0xff,0xff,0xff,0xff,0xff,0xff,  # full block
-    0x01,0x03,0x07,0x0f,0x07,0x03,0x01,0x00,  # triangle right
-    0x08,0x1c,0x3e,0x7f,0x3e,0x1c,0x08,0x00,  # diamond
-    0x18,0x18,0x18,0x18,0xff,0x18,0x18,0x18,  # plus
-    0xc0,0xc0,0xc0,0xc0,0xc0,0xc0,0xc0,0xc0,  # left edge
-    0x00,0x00,0x00,0xfe,0xfe,0x06,0x06,0x06,  # corner DR
-    0x00,0x7e,0x7e,0x7e,0x7e,0x7e,0x7e,0x00,  # square
-    0x18,0x7e,0x7e,0x18,0x18,0x7e,0x3c,0x00,  # pi
-    0x06,0x06,0x06,0xfe,0xfe,0x00,0x00,0x00,  # corner UR
-    0x18,0x3c,0x7e,0x18,0x18,0x18,0x18,0x00,  # arrow up
-    0x10,0x30,0x7f,0x7f,0x7f,0x30,0x10,0x00,  # arrow left
+    "000000ffff000000"  # horiz line
+    "367f7f7f3e1c0800"  # spade
+    "1818181818181818"  # vert line
+    "000000ffff181818"  # T up
+    "181818ffff000000"  # T down
+    "181818f8f8181818"  # T left
+    "0000033e76363600"  # curve TR
+    "0000c07c6e6c6c00"  # curve TL
+    "3636763e03000000"  # curve BR
+    "6c6c6e7cc0000000"  # curve BL
+    "1818181f1f181818"  # T right
+    "0000001f1f181818"  # corner TL
+    "1818181f1f000000"  # corner BL
+    "181818f8f8000000"  # corner BR
+    "000000f8f8181818"  # corner TR
+    "181818ffff181818"  # cross
+    "0000000f0f0f0f00"  # block BR
+    "000000f0f0f0f000"  # block BL
+    "0f0f0f0f00000000"  # block TR
+    "081c3e7f7f1c3e00"  # club
+    "f0f0f0f000000000"  # block TL
+    "80c0e0f0e0c08000"  # triangle left
+    "ffffffffffffffff"  # full block
+    "0103070f07030100"  # triangle right
+    "081c3e7f3e1c0800"  # diamond
+    "18181818ff181818"  # plus
+    "c0c0c0c0c0c0c0c0"  # left edge
+    "000000fefe060606"  # corner DR
+    "007e7e7e7e7e7e00"  # square
+    "187e7e18187e3c00"  # pi
+    "060606fefe000000"  # corner UR
+    "183c7e1818181800"  # arrow up
+    "10307f7f7f301000"  # arrow left
     # Characters 96-127 (lowercase letters in PETSCII are graphics)
-    0x00,0x00,0x00,0x00,0x00,0x00,0xff,0xff,  # bottom bar
-    0x08,0x1c,0x3e,0x7f,0x3e,0x1c,0x08,0x00,  # diamond
-    0xff,0xff,0x00,0x00,0x00,0x00,0x00,0x00,  # top bar
-    0x00,0x00,0x00,0x00,0x00,0xff,0xff,0xff,  # btm thick bar
-    0x03,0x03,0x03,0x03,0x03,0x03,0x03,0x03,  # right edge
-    0x00,0x00,0x00,0x00,0x0f,0x0f,0x0f,0x0f,  # btm right quad
-    0xf0,0xf0,0xf0,0xf0,0x00,0x00,0x00,0x00,  # top left quad
-    0x0f,0x0f,0x0f,0x0f,0xf0,0xf0,0xf0,0xf0,  # checkerboard
-    0x0f,0x0f,0x0f,0x0f,0x00,0x00,0x00,0x00,  # top right quad
-    0x00,0x00,0x00,0x00,0xf0,0xf0,0xf0,0xf0,  # btm left quad
-    0x18,0x18,0x18,0x18,0x00,0x00,0x18,0x18,  # vert split
-    0x00,0xc6,0x7c,0xc6,0xc6,0x7c,0xc6,0x00,  # circled times
-    0x00,0x00,0x00,0x18,0x18,0x00,0x00,0x00,  # center dot
-    0x00,0x00,0x60,0x60,0x00,0x00,0x00,0x00,  # upper left dot
-    0xf0,0xf0,0xf0,0xf0,0xf0,0xf0,0xf0,0xf0,  # left half
-    0x00,0x00,0x06,0x06,0x00,0x00,0x00,0x00,  # upper right dot
-    0xff,0xff,0xff,0xff,0x00,0x00,0x00,0x00,  # top half
-    0x36,0x7f,0x7f,0x7f,0x3e,0x1c,0x08,0x00,  # spade
-    0x00,0x00,0x00,0x00,0x00,0x00,0x06,0x06,  # lower right dot
-    0x66,0x66,0x66,0x66,0x66,0x00,0x66,0x00,  # vert bars
-    0x7e,0xdb,0xdb,0x7b,0x1b,0x1b,0x1b,0x00,  # para
-    0x3c,0x60,0x3c,0x66,0x3c,0x06,0x3c,0x00,  # section
-    0x00,0x00,0x00,0x00,0x00,0x00,0x60,0x60,  # lower left dot
-    0x00,0x00,0x00,0x00,0xff,0xff,0xff,0xff,  # btm half
-    0x08,0x1c,0x3e,0x7f,0x7f,0x1c,0x3e,0x00,  # club
-    0x36,0x36,0x7f,0x7f,0x7f,0x3e,0x1c,0x00,  # heart
-    0x0f,0x0f,0x0f,0x0f,0x0f,0x0f,0x0f,0x0f,  # right half
-    0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,  # vert line
-    0x00,0x00,0x00,0x07,0x0f,0x1c,0x18,0x18,  # curve UL
-    0x18,0x18,0x1c,0x0f,0x07,0x00,0x00,0x00,  # curve LL
-    0x18,0x18,0x38,0xf0,0xe0,0x00,0x00,0x00,  # curve LR
-    0x00,0x00,0x00,0xe0,0xf0,0x38,0x18,0x18,  # curve UR
+    "000000000000ffff"  # bottom bar
+    "081c3e7f3e1c0800"  # diamond
+    "ffff000000000000"  # top bar
+    "0000000000ffffff"  # btm thick bar
+    "0303030303030303"  # right edge
+    "000000000f0f0f0f"  # btm right quad
+    "f0f0f0f000000000"  # top left quad
+    "0f0f0f0ff0f0f0f0"  # checkerboard
+    "0f0f0f0f00000000"  # top right quad
+    "00000000f0f0f0f0"  # btm left quad
+    "1818181800001818"  # vert split
+    "00c67cc6c67cc600"  # circled times
+    "0000001818000000"  # center dot
+    "0000606000000000"  # upper left dot
+    "f0f0f0f0f0f0f0f0"  # left half
+    "0000060600000000"  # upper right dot
+    "ffffffff00000000"  # top half
+    "367f7f7f3e1c0800"  # spade
+    "0000000000000606"  # lower right dot
+    "6666666666006600"  # vert bars
+    "7edbdb7b1b1b1b00"  # para
+    "3c603c663c063c00"  # section
+    "0000000000006060"  # lower left dot
+    "00000000ffffffff"  # btm half
+    "081c3e7f7f1c3e00"  # club
+    "36367f7f7f3e1c00"  # heart
+    "0f0f0f0f0f0f0f0f"  # right half
+    "1818181818181818"  # vert line
+    "000000070f1c1818"  # curve UL
+    "18181c0f07000000"  # curve LL
+    "181838f0e0000000"  # curve LR
     # Characters 128-159 (reversed @-_ )
-    0xc3,0x99,0x91,0x91,0x9f,0x9d,0xc3,0xff,  # @ reversed
-    0xe7,0xc3,0x99,0x81,0x99,0x99,0x99,0xff,  # A reversed
-    0x83,0x99,0x99,0x83,0x99,0x99,0x83,0xff,  # B reversed
-    0xc3,0x99,0x9f,0x9f,0x9f,0x99,0xc3,0xff,  # C reversed
-    0x87,0x93,0x99,0x99,0x99,0x93,0x87,0xff,  # D reversed
-    0x81,0x9f,0x9f,0x87,0x9f,0x9f,0x81,0xff,  # E reversed
-    0x81,0x9f,0x9f,0x87,0x9f,0x9f,0x9f,0xff,  # F reversed
-    0xc3,0x99,0x9f,0x91,0x99,0x99,0xc3,0xff,  # G reversed
-    0x99,0x99,0x99,0x81,0x99,0x99,0x99,0xff,  # H reversed
-    0xc3,0xe7,0xe7,0xe7,0xe7,0xe7,0xc3,0xff,  # I reversed
-    0xe1,0xf3,0xf3,0xf3,0xf3,0x93,0xc7,0xff,  # J reversed
-    0x99,0x93,0x87,0x8f,0x87,0x93,0x99,0xff,  # K reversed
-    0x9f,0x9f,0x9f,0x9f,0x9f,0x9f,0x81,0xff,  # L reversed
-    0x9c,0x88,0x80,0x94,0x9c,0x9c,0x9c,0xff,  # M reversed
-    0x99,0x89,0x81,0x81,0x91,0x99,0x99,0xff,  # N reversed
-    0xc3,0x99,0x99,0x99,0x99,0x99,0xc3,0xff,  # O reversed
-    0x83,0x99,0x99,0x83,0x9f,0x9f,0x9f,0xff,  # P reversed
-    0xc3,0x99,0x99,0x99,0x99,0xc3,0xf1,0xff,  # Q reversed
-    0x83,0x99,0x99,0x83,0x87,0x93,0x99,0xff,  # R reversed
-    0xc3,0x99,0x9f,0xc3,0xf9,0x99,0xc3,0xff,  # S reversed
-    0x81,0xe7,0xe7,0xe7,0xe7,0xe7,0xe7,0xff,  # T reversed
-    0x99,0x99,0x99,0x99,0x99,0x99,0xc3,0xff,  # U reversed
-    0x99,0x99,0x99,0x99,0x99,0xc3,0xe7,0xff,  # V reversed
-    0x9c,0x9c,0x9c,0x94,0x80,0x88,0x9c,0xff,  # W reversed
-    0x99,0x99,0xc3,0xe7,0xc3,0x99,0x99,0xff,  # X reversed
-    0x99,0x99,0x99,0xc3,0xe7,0xe7,0xe7,0xff,  # Y reversed
-    0x81,0xf9,0xf3,0xe7,0xcf,0x9f,0x81,0xff,  # Z reversed
-    0xc3,0xcf,0xcf,0xcf,0xcf,0xcf,0xc3,0xff,  # [ reversed
-    0xf3,0xed,0xcf,0x83,0xcf,0x9d,0x03,0xff,  # pound reversed
-    0xc3,0xf3,0xf3,0xf3,0xf3,0xf3,0xc3,0xff,  # ] reversed
-    0xff,0xe7,0xc3,0x81,0xe7,0xe7,0xe7,0xe7,  # up arrow rev
-    0xff,0xef,0xcf,0x80,0x80,0xcf,0xef,0xff,  # left arrow rev
+    "c39991919f9dc3ff"  # @ reversed
+    "e7c39981999999ff"  # A reversed
+    "83999983999983ff"  # B reversed
+    "c3999f9f9f99c3ff"  # C reversed
+    "87939999999387ff"  # D reversed
+    "819f9f879f9f81ff"  # E reversed
+    "819f9f879f9f9fff"  # F reversed
+    "c3999f919999c3ff"  # G reversed
+    "99999981999999ff"  # H reversed
+    "c3e7e7e7e7e7c3ff"  # I reversed
+    "e1f3f3f3f393c7ff"  # J reversed
+    "9993878f879399ff"  # K reversed
+    "9f9f9f9f9f9f81ff"  # L reversed
+    "9c8880949c9c9cff"  # M reversed
+    "99898181919999ff"  # N reversed
+    "c39999999999c3ff"  # O reversed
+    "839999839f9f9fff"  # P reversed
+    "c399999999c3f1ff"  # Q reversed
+    "83999983879399ff"  # R reversed
+    "c3999fc3f999c3ff"  # S reversed
+    "81e7e7e7e7e7e7ff"  # T reversed
+    "999999999999c3ff"  # U reversed
+    "9999999999c3e7ff"  # V reversed
+    "9c9c9c9480889cff"  # W reversed
+    "9999c3e7c39999ff"  # X reversed
+    "999999c3e7e7e7ff"  # Y reversed
+    "81f9f3e7cf9f81ff"  # Z reversed
+    "c3cfcfcfcfcfc3ff"  # [ reversed
+    "f3edcf83cf9d03ff"  # pound reversed
+    "c3f3f3f3f3f3c3ff"  # ] reversed
+    "ffe7c381e7e7e7e7"  # up arrow rev
+    "ffefcf8080cfefff"  # left arrow rev
     # Characters 160-191 (reversed space-?)
-    0xff,0xff,0xff,0xff,0xff,0xff,0xff,0xff,  # space reversed
-    0xe7,0xe7,0xe7,0xe7,0xff,0xff,0xe7,0xff,  # ! reversed
-    0x99,0x99,0x99,0xff,0xff,0xff,0xff,0xff,  # " reversed
-    0x99,0x99,0x00,0x99,0x00,0x99,0x99,0xff,  # # reversed
-    0xe7,0xc1,0x9f,0xc3,0xf9,0x83,0xe7,0xff,  # $ reversed
-    0x9d,0x99,0xf3,0xe7,0xcf,0x99,0xb9,0xff,  # % reversed
-    0xc3,0x99,0xc3,0xc7,0x98,0x99,0xc0,0xff,  # & reversed
-    0xf9,0xf3,0xe7,0xff,0xff,0xff,0xff,0xff,  # ' reversed
-    0xf3,0xe7,0xcf,0xcf,0xcf,0xe7,0xf3,0xff,  # ( reversed
-    0xcf,0xe7,0xf3,0xf3,0xf3,0xe7,0xcf,0xff,  # ) reversed
-    0xff,0x99,0xc3,0x00,0xc3,0x99,0xff,0xff,  # * reversed
-    0xff,0xe7,0xe7,0x81,0xe7,0xe7,0xff,0xff,  # + reversed
-    0xff,0xff,0xff,0xff,0xff,0xe7,0xe7,0xcf,  # , reversed
-    0xff,0xff,0xff,0x81,0xff,0xff,0xff,0xff,  # - reversed
-    0xff,0xff,0xff,0xff,0xff,0xe7,0xe7,0xff,  # . reversed
-    0xff,0xfc,0xf9,0xf3,0xe7,0xcf,0x9f,0xff,  # / reversed
-    0xc3,0x99,0x91,0x89,0x99,0x99,0xc3,0xff,  # 0 reversed
-    0xe7,0xe7,0xc7,0xe7,0xe7,0xe7,0x81,0xff,  # 1 reversed
-    0xc3,0x99,0xf9,0xf3,0xcf,0x9f,0x81,0xff,  # 2 reversed
-    0xc3,0x99,0xf9,0xe3,0xf9,0x99,0xc3,0xff,  # 3 reversed
-    0xf9,0xf1,0xe1,0x99,0x80,0xf9,0xf9,0xff,  # 4 reversed
-    0x81,0x9f,0x83,0xf9,0xf9,0x99,0xc3,0xff,  # 5 reversed
-    0xc3,0x99,0x9f,0x83,0x99,0x99,0xc3,0xff,  # 6 reversed
-    0x81,0x99,0xf3,0xe7,0xe7,0xe7,0xe7,0xff,  # 7 reversed
-    0xc3,0x99,0x99,0xc3,0x99,0x99,0xc3,0xff,  # 8 reversed
-    0xc3,0x99,0x99,0xc1,0xf9,0x99,0xc3,0xff,  # 9 reversed
-    0xff,0xff,0xe7,0xff,0xff,0xe7,0xff,0xff,  # : reversed
-    0xff,0xff,0xe7,0xff,0xff,0xe7,0xe7,0xcf,  # ; reversed
-    0xf1,0xe7,0xcf,0x9f,0xcf,0xe7,0xf1,0xff,  # < reversed
-    0xff,0xff,0x81,0xff,0x81,0xff,0xff,0xff,  # = reversed
-    0x8f,0xe7,0xf3,0xf9,0xf3,0xe7,0x8f,0xff,  # > reversed
-    0xc3,0x99,0xf9,0xf3,0xe7,0xff,0xe7,0xff,  # ? reversed
+    "ffffffffffffffff"  # space reversed
+    "e7e7e7e7ffffe7ff"  # ! reversed
+    "999999ffffffffff"  # " reversed
+    "99990099009999ff"  # # reversed
+    "e7c19fc3f983e7ff"  # $ reversed
+    "9d99f3e7cf99b9ff"  # % reversed
+    "c399c3c79899c0ff"  # & reversed
+    "f9f3e7ffffffffff"  # ' reversed
+    "f3e7cfcfcfe7f3ff"  # ( reversed
+    "cfe7f3f3f3e7cfff"  # ) reversed
+    "ff99c300c399ffff"  # * reversed
+    "ffe7e781e7e7ffff"  # + reversed
+    "ffffffffffe7e7cf"  # , reversed
+    "ffffff81ffffffff"  # - reversed
+    "ffffffffffe7e7ff"  # . reversed
+    "fffcf9f3e7cf9fff"  # / reversed
+    "c39991899999c3ff"  # 0 reversed
+    "e7e7c7e7e7e781ff"  # 1 reversed
+    "c399f9f3cf9f81ff"  # 2 reversed
+    "c399f9e3f999c3ff"  # 3 reversed
+    "f9f1e19980f9f9ff"  # 4 reversed
+    "819f83f9f999c3ff"  # 5 reversed
+    "c3999f839999c3ff"  # 6 reversed
+    "8199f3e7e7e7e7ff"  # 7 reversed
+    "c39999c39999c3ff"  # 8 reversed
+    "c39999c1f999c3ff"  # 9 reversed
+    "ffffe7ffffe7ffff"  # : reversed
+    "ffffe7ffffe7e7cf"  # ; reversed
+    "f1e7cf9fcfe7f1ff"  # < reversed
+    "ffff81ff81ffffff"  # = reversed
+    "8fe7f3f9f3e78fff"  # > reversed
+    "c399f9f3e7ffe7ff"  # ? reversed
     # Characters 192-223 (reversed graphics)
-    0xff,0xff,0xff,0x00,0x00,0xff,0xff,0xff,  # horiz line rev
-    0xc9,0x80,0x80,0x80,0xc1,0xe3,0xf7,0xff,  # spade rev
-    0xe7,0xe7,0xe7,0xe7,0xe7,0xe7,0xe7,0xe7,  # vert line
-    0xff,0xff,0xff,0x00,0x00,0xe7,0xe7,0xe7,  # T up rev
-    0xe7,0xe7,0xe7,0x00,0x00,0xff,0xff,0xff,  # T down rev
-    0xe7,0xe7,0xe7,0x07,0x07,0xe7,0xe7,0xe7,  # T left rev
-    0xff,0xff,0xfc,0xc1,0x89,0xc9,0xc9,0xff,  # curve TR rev
-    0xff,0xff,0x3f,0x83,0x91,0x93,0x93,0xff,  # curve TL rev
-    0xc9,0xc9,0x89,0xc1,0xfc,0xff,0xff,0xff,  # curve BR rev
-    0x93,0x93,0x91,0x83,0x3f,0xff,0xff,0xff,  # curve BL rev
-    0xe7,0xe7,0xe7,0xe0,0xe0,0xe7,0xe7,0xe7,  # T right rev
-    0xff,0xff,0xff,0xe0,0xe0,0xe7,0xe7,0xe7,  # corner TL rev
-    0xe7,0xe7,0xe7,0xe0,0xe0,0xff,0xff,0xff,  # corner BL rev
-    0xe7,0xe7,0xe7,0x07,0x07,0xff,0xff,0xff,  # corner BR rev
-    0xff,0xff,0xff,0x07,0x07,0xe7,0xe7,0xe7,  # corner TR rev
-    0xe7,0xe7,0xe7,0x00,0x00,0xe7,0xe7,0xe7,  # cross rev
-    0xff,0xff,0xff,0xf0,0xf0,0xf0,0xf0,0xff,  # block BR rev
-    0xff,0xff,0xff,0x0f,0x0f,0x0f,0x0f,0xff,  # block BL rev
-    0xf0,0xf0,0xf0,0xf0,0xff,0xff,0xff,0xff,  # block TR rev
-    0xf7,0xe3,0xc1,0x80,0x80,0xe3,0xc1,0xff,  # club rev
-    0x0f,0x0f,0x0f,0x0f,0xff,0xff,0xff,0xff,  # block TL rev
-    0x7f,0x3f,0x1f,0x0f,0x1f,0x3f,0x7f,0xff,  # triangle left rev
-    0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  # full block rev (empty)
-    0xfe,0xfc,0xf8,0xf0,0xf8,0xfc,0xfe,0xff,  # triangle right rev
-    0xf7,0xe3,0xc1,0x80,0xc1,0xe3,0xf7,0xff,  # diamond rev
-    0xe7,0xe7,0xe7,0xe7,0x00,0xe7,0xe7,0xe7,  # plus rev
-    0x3f,0x3f,0x3f,0x3f,0x3f,0x3f,0x3f,0x3f,  # left edge rev
-    0xff,0xff,0xff,0x01,0x01,0xf9,0xf9,0xf9,  # corner DR rev
-    0xff,0x81,0x81,0x81,0x81,0x81,0x81,0xff,  # square rev
-    0xe7,0x81,0x81,0xe7,0xe7,0x81,0xc3,0xff,  # pi rev
-    0xf9,0xf9,0xf9,0x01,0x01,0xff,0xff,0xff,  # corner UR rev
-    0xe7,0xc3,0x81,0xe7,0xe7,0xe7,0xe7,0xff,  # arrow up rev
-    0xef,0xcf,0x80,0x80,0x80,0xcf,0xef,0xff,  # arrow left rev
+    "ffffff0000ffffff"  # horiz line rev
+    "c9808080c1e3f7ff"  # spade rev
+    "e7e7e7e7e7e7e7e7"  # vert line
+    "ffffff0000e7e7e7"  # T up rev
+    "e7e7e70000ffffff"  # T down rev
+    "e7e7e70707e7e7e7"  # T left rev
+    "fffffcc189c9c9ff"  # curve TR rev
+    "ffff3f83919393ff"  # curve TL rev
+    "c9c989c1fcffffff"  # curve BR rev
+    "939391833fffffff"  # curve BL rev
+    "e7e7e7e0e0e7e7e7"  # T right rev
+    "ffffffe0e0e7e7e7"  # corner TL rev
+    "e7e7e7e0e0ffffff"  # corner BL rev
+    "e7e7e70707ffffff"  # corner BR rev
+    "ffffff0707e7e7e7"  # corner TR rev
+    "e7e7e70000e7e7e7"  # cross rev
+    "fffffff0f0f0f0ff"  # block BR rev
+    "ffffff0f0f0f0fff"  # block BL rev
+    "f0f0f0f0ffffffff"  # block TR rev
+    "f7e3c18080e3c1ff"  # club rev
+    "0f0f0f0fffffffff"  # block TL rev
+    "7f3f1f0f1f3f7fff"  # triangle left rev
+    "0000000000000000"  # full block rev (empty)
+    "fefcf8f0f8fcfeff"  # triangle right rev
+    "f7e3c180c1e3f7ff"  # diamond rev
+    "e7e7e7e700e7e7e7"  # plus rev
+    "3f3f3f3f3f3f3f3f"  # left edge rev
+    "ffffff0101f9f9f9"  # corner DR rev
+    "ff818181818181ff"  # square rev
+    "e78181e7e781c3ff"  # pi rev
+    "f9f9f90101ffffff"  # corner UR rev
+    "e7c381e7e7e7e7ff"  # arrow up rev
+    "efcf808080cfefff"  # arrow left rev
     # Characters 224-255 (more reversed graphics)
-    0xff,0xff,0xff,0xff,0xff,0xff,0x00,0x00,  # bottom bar rev
-    0xf7,0xe3,0xc1,0x80,0xc1,0xe3,0xf7,0xff,  # diamond rev
-    0x00,0x00,0xff,0xff,0xff,0xff,0xff,0xff,  # top bar rev
-    0xff,0xff,0xff,0xff,0xff,0x00,0x00,0x00,  # btm thick bar rev
-    0xfc,0xfc,0xfc,0xfc,0xfc,0xfc,0xfc,0xfc,  # right edge rev
-    0xff,0xff,0xff,0xff,0xf0,0xf0,0xf0,0xf0,  # btm right quad rev
-    0x0f,0x0f,0x0f,0x0f,0xff,0xff,0xff,0xff,  # top left quad rev
-    0xf0,0xf0,0xf0,0xf0,0x0f,0x0f,0x0f,0x0f,  # checkerboard rev
-    0xf0,0xf0,0xf0,0xf0,0xff,0xff,0xff,0xff,  # top right quad rev
-    0xff,0xff,0xff,0xff,0x0f,0x0f,0x0f,0x0f,  # btm left quad rev
-    0xe7,0xe7,0xe7,0xe7,0xff,0xff,0xe7,0xe7,  # vert split rev
-    0xff,0x39,0x83,0x39,0x39,0x83,0x39,0xff,  # circled times rev
-    0xff,0xff,0xff,0xe7,0xe7,0xff,0xff,0xff,  # center dot rev
-    0xff,0xff,0x9f,0x9f,0xff,0xff,0xff,0xff,  # upper left dot rev
-    0x0f,0x0f,0x0f,0x0f,0x0f,0x0f,0x0f,0x0f,  # left half rev
-    0xff,0xff,0xf9,0xf9,0xff,0xff,0xff,0xff,  # upper right dot rev
-    0x00,0x00,0x00,0x00,0xff,0xff,0xff,0xff,  # top half rev
-    0xc9,0x80,0x80,0x80,0xc1,0xe3,0xf7,0xff,  # spade rev
-    0xff,0xff,0xff,0xff,0xff,0xff,0xf9,0xf9,  # lower right dot rev
-    0x99,0x99,0x99,0x99,0x99,0xff,0x99,0xff,  # vert bars rev
-    0x81,0x24,0x24,0x84,0xe4,0xe4,0xe4,0xff,  # para rev
-    0xc3,0x9f,0xc3,0x99,0xc3,0xf9,0xc3,0xff,  # section rev
-    0xff,0xff,0xff,0xff,0xff,0xff,0x9f,0x9f,  # lower left dot rev
-    0xff,0xff,0xff,0xff,0x00,0x00,0x00,0x00,  # btm half rev
-    0xf7,0xe3,0xc1,0x80,0x80,0xe3,0xc1,0xff,  # club rev
-    0xc9,0xc9,0x80,0x80,0x80,0xc1,0xe3,0xff,  # heart rev
-    0xf0,0xf0,0xf0,0xf0,0xf0,0xf0,0xf0,0xf0,  # right half rev
-    0xe7,0xe7,0xe7,0xe7,0xe7,0xe7,0xe7,0xe7,  # vert line
-    0xff,0xff,0xff,0xf8,0xf0,0xe3,0xe7,0xe7,  # curve UL rev
-    0xe7,0xe7,0xe3,0xf0,0xf8,0xff,0xff,0xff,  # curve LL rev
-    0xe7,0xe7,0xc7,0x0f,0x1f,0xff,0xff,0xff,  # curve LR rev
-    0xff,0xff,0xff,0x1f,0x0f,0xc7,0xe7,0xe7,  # curve UR rev
-])
+    "ffffffffffff0000"  # bottom bar rev
+    "f7e3c180c1e3f7ff"  # diamond rev
+    "0000ffffffffffff"  # top bar rev
+    "ffffffffff000000"  # btm thick bar rev
+    "fcfcfcfcfcfcfcfc"  # right edge rev
+    "fffffffff0f0f0f0"  # btm right quad rev
+    "0f0f0f0fffffffff"  # top left quad rev
+    "f0f0f0f00f0f0f0f"  # checkerboard rev
+    "f0f0f0f0ffffffff"  # top right quad rev
+    "ffffffff0f0f0f0f"  # btm left quad rev
+    "e7e7e7e7ffffe7e7"  # vert split rev
+    "ff398339398339ff"  # circled times rev
+    "ffffffe7e7ffffff"  # center dot rev
+    "ffff9f9fffffffff"  # upper left dot rev
+    "0f0f0f0f0f0f0f0f"  # left half rev
+    "fffff9f9ffffffff"  # upper right dot rev
+    "00000000ffffffff"  # top half rev
+    "c9808080c1e3f7ff"  # spade rev
+    "fffffffffffff9f9"  # lower right dot rev
+    "9999999999ff99ff"  # vert bars rev
+    "81242484e4e4e4ff"  # para rev
+    "c39fc399c3f9c3ff"  # section rev
+    "ffffffffffff9f9f"  # lower left dot rev
+    "ffffffff00000000"  # btm half rev
+    "f7e3c18080e3c1ff"  # club rev
+    "c9c9808080c1e3ff"  # heart rev
+    "f0f0f0f0f0f0f0f0"  # right half rev
+    "e7e7e7e7e7e7e7e7"  # vert line
+    "fffffff8f0e3e7e7"  # curve UL rev
+    "e7e7e3f0f8ffffff"  # curve LL rev
+    "e7e7c70f1fffffff"  # curve LR rev
+)
+
+# REST API endpoints for DMA memory access and CPU control
+READMEM_PATH = "/v1/machine:readmem"
+WRITEMEM_PATH = "/v1/machine:writemem"
+PAUSE_PATH = "/v1/machine:pause"
+RESUME_PATH = "/v1/machine:resume"
 
 # Keyboard buffer constants
 KEYBUF_ADDR = 0x0277  # Keyboard buffer (10 bytes)
@@ -1,18 +1,35 @@
 import asyncio
 from tools.utils import ascii_to_petscii
-from tools.c64_data import KEYBUF_ADDR, KEYBUF_LEN_ADDR, KEYBUF_MAX_SIZE
+from tools.c64_data import (
+    KEYBUF_ADDR,
+    KEYBUF_LEN_ADDR,
+    KEYBUF_MAX_SIZE,
+    READMEM_PATH,
+    WRITEMEM_PATH,
+)
+
+# How often and how long to poll the buffer length while the KERNAL drains it.
+# Polling starts quick and backs off so a slow drain doesn't flood the device
+KEYBUF_POLL_INTERVAL = 0.02
+KEYBUF_POLL_MAX_INTERVAL = 0.1
+KEYBUF_WAIT_TIMEOUT = 5.0
 
 async def wait_for_empty_buffer(client):
     """Wait for the C64 keyboard buffer to be empty."""
-    for _ in range(50):  # Max 50 attempts (5 seconds)
-        resp = await client.get("/v1/machine:readmem", params={
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + KEYBUF_WAIT_TIMEOUT
+    interval = KEYBUF_POLL_INTERVAL
+    while True:
+        resp = await client.get(READMEM_PATH, params={
             "address": f"{KEYBUF_LEN_ADDR:02X}", "length": 1
         })
         resp.raise_for_status()
         if resp.content[0] == 0:
             return True
-        await asyncio.sleep(0.1)
-    return False
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, KEYBUF_POLL_MAX_INTERVAL)
 
 async def type_text_logic(client, text, wait_ms=100):
     """Externalized logic for typing text into the C64 keyboard buffer."""
@@ -35,7 +52,7 @@ async def type_text_logic(client, text, wait_ms=100):
 
         # Write characters to keyboard buffer
         resp = await client.post(
-            "/v1/machine:writemem",
+            WRITEMEM_PATH,
             params={"address": f"{KEYBUF_ADDR:04X}"},
             content=chunk
         )
@@ -43,17 +60,15 @@ async def type_text_logic(client, text, wait_ms=100):
 
         # Set buffer length
         resp = await client.post(
-            "/v1/machine:writemem",
+            WRITEMEM_PATH,
             params={"address": f"{KEYBUF_LEN_ADDR:02X}"},
             content=bytes([chunk_len])
         )
         resp.raise_for_status()
 
         total_typed += chunk_len
-
-        # Wait for processing if more chunks to come
-        if i + KEYBUF_MAX_SIZE < len(petscii_bytes):
-            await asyncio.sleep(wait_ms / 1000.0)
+        # The next chunk is written as soon as the buffer has drained, so no
+        # fixed delay is needed between chunks
 
     # Final wait for buffer processing
     if wait_ms > 0:
@@ -95,7 +110,7 @@ async def send_key_logic(client, key):
 
     # Write key to keyboard buffer
     resp = await client.post(
-        "/v1/machine:writemem",
+        WRITEMEM_PATH,
         params={"address": f"{KEYBUF_ADDR:04X}"},
         content=bytes([code])
     )
@@ -103,7 +118,7 @@ async def send_key_logic(client, key):
 
     # Set buffer length to 1
     resp = await client.post(
-        "/v1/machine:writemem",
+        WRITEMEM_PATH,
         params={"address": f"{KEYBUF_LEN_ADDR:02X}"},
         content=bytes([1])
     )
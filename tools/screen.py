@@ -1,9 +1,18 @@
 import io
-import base64
+import asyncio
+import binascii
+import functools
 import httpx
+from dataclasses import dataclass
 from enum import Enum
 from PIL import Image
-from tools.c64_data import C64_PALETTE, C64_CHARSET
+from tools.c64_data import (
+    C64_PALETTE_BYTES,
+    C64_CHARSET,
+    READMEM_PATH,
+    PAUSE_PATH,
+    RESUME_PATH,
+)
 
 
 class ScreenMode(Enum):
@@ -49,20 +58,33 @@ class ScreenMode(Enum):
             return cls.STANDARD_TEXT
 
 
+@dataclass(slots=True)
+class ScreenImage:
+    """A rendered screen capture: base64 PNG data plus a description of what was captured."""
+    data: str
+    info: str
+    mime_type: str = "image/png"
+
+
+async def _read_memory(client: httpx.AsyncClient, address: int, length: int) -> bytes:
+    """Read a block of C64 memory via DMA."""
+    resp = await client.get(READMEM_PATH, params={"address": f"{address:04X}", "length": length})
+    resp.raise_for_status()
+    return resp.content
+
+
 async def read_vic_state(client: httpx.AsyncClient) -> dict:
     """
     Read VIC-II and related registers from C64 memory.
     Returns a dict with all relevant video state.
     """
-    # Read VIC-II registers ($D000-$D02E)
-    resp = await client.get("/v1/machine:readmem", params={"address": "D000", "length": 48})
-    resp.raise_for_status()
-    vic_regs = resp.content
-
-    # Read CIA2 port A ($DD00) for VIC bank selection
-    resp = await client.get("/v1/machine:readmem", params={"address": "DD00", "length": 1})
-    resp.raise_for_status()
-    cia2_pra = resp.content[0]
+    # Read VIC-II registers ($D000-$D02E) and CIA2 port A ($DD00) for VIC
+    # bank selection together
+    vic_regs, cia2 = await asyncio.gather(
+        _read_memory(client, 0xD000, 48),
+        _read_memory(client, 0xDD00, 1),
+    )
+    cia2_pra = cia2[0]
 
     # Parse VIC-II registers
     d011 = vic_regs[0x11]  # Control register 1
@@ -117,11 +139,11 @@ async def detect_screen_mode_logic(client: httpx.AsyncClient) -> dict:
     Returns mode info including enum value, display name, and memory addresses.
     Properly handles custom screen memory allocation (non-$0400 screen addresses).
     """
-    await client.put("/v1/machine:pause")
+    await client.put(PAUSE_PATH)
     try:
         vic_state = await read_vic_state(client)
     finally:
-        await client.put("/v1/machine:resume")
+        await client.put(RESUME_PATH)
 
     mode = vic_state["mode"]
     vic_bank = vic_state["vic_bank"]
@@ -179,9 +201,186 @@ async def detect_screen_mode_logic(client: httpx.AsyncClient) -> dict:
     return result
 
 
-async def capture_screen_logic(client: httpx.AsyncClient, scale: int = 2, include_border: bool = True):
+# Lookup tables for rendering a whole 320-pixel raster line at a time.
+# Each 8-byte entry expands one bitmap or per-cell byte into 8 pixels, and a
+# line is then treated as one big integer so colours can be combined with
+# bitwise masks instead of per-pixel Python loops.
+_REPEAT8 = [bytes([value]) * 8 for value in range(256)]
+_HIRES_MASKS = [
+    bytes(0xFF if byte & (0x80 >> col) else 0 for col in range(8))
+    for byte in range(256)
+]
+# High and low bit of each 2-bit multicolor pixel; the pixels are double width
+_MULTICOLOR_HIGH_MASKS = [
+    bytes(0xFF if byte & (0x80 >> (col & 6)) else 0 for col in range(8))
+    for byte in range(256)
+]
+_MULTICOLOR_LOW_MASKS = [
+    bytes(0xFF if byte & (0x40 >> (col & 6)) else 0 for col in range(8))
+    for byte in range(256)
+]
+_MULTICOLOR_FLAG_MASKS = [b"\xff" * 8 if byte & 0x08 else bytes(8) for byte in range(256)]
+
+# bytes.translate tables for per-cell byte fields
+_HIGH_NIBBLE = bytes(byte >> 4 for byte in range(256))
+_LOW_NIBBLE = bytes(byte & 0x0F for byte in range(256))
+_LOW_3_BITS = bytes(byte & 0x07 for byte in range(256))
+_ECM_CHAR_CODE = bytes(byte & 0x3F for byte in range(256))
+
+
+def _expand_line(table: list[bytes], cells: bytes) -> int:
+    """Expand 40 bytes through an 8-byte-per-entry table into a 320-pixel line."""
+    return int.from_bytes(b"".join(map(table.__getitem__, cells)), "big")
+
+
+def _fill_line(color: int) -> int:
+    """A 320-pixel line of a single colour."""
+    return int.from_bytes(bytes([color]) * 320, "big")
+
+
+def _pack_lines(lines: list[int]) -> bytes:
+    """Join rendered lines into a 320x200 buffer of palette indices."""
+    return b"".join(line.to_bytes(320, "big") for line in lines)
+
+
+@functools.lru_cache(maxsize=8)
+def _glyph_rows(char_data: bytes | None) -> tuple[bytes, ...]:
+    """
+    Split character data into 8 translate tables, one per glyph row, that map
+    a character code to that row's bitmap byte. Missing data renders blank.
+    Cached by charset contents, so the ROM charset and any custom charset that
+    stays put between captures are only split once.
+    """
+    char_data = bytes(char_data or b"").ljust(2048, b"\x00")
+    return tuple(char_data[row:2048:8] for row in range(8))
+
+
+def _multicolor_line(colors: list[int], data: bytes) -> int:
+    """Select one of four colour lines per double-width pixel of a 2-bit line."""
+    high = _expand_line(_MULTICOLOR_HIGH_MASKS, data)
+    low = _expand_line(_MULTICOLOR_LOW_MASKS, data)
+    c0, c1, c2, c3 = colors
+    # Pick between %x0 and %x1 with the low bit, then between %0x and %1x
+    lower = (c1 & low) | (c0 & ~low)
+    upper = (c3 & low) | (c2 & ~low)
+    return (upper & high) | (lower & ~high)
+
+
+def _render_standard_text(screen_ram: bytes, color_ram: bytes, char_data: bytes | None, bg_color: int) -> bytes:
+    """Standard text: one foreground colour per cell over the background."""
+    glyph_rows = _glyph_rows(char_data)
+    bg = _fill_line(bg_color)
+    lines = []
+    for cell in range(0, 1000, 40):
+        codes = screen_ram[cell:cell + 40]
+        fg = _expand_line(_REPEAT8, color_ram[cell:cell + 40].translate(_LOW_NIBBLE))
+        for glyph_row in glyph_rows:
+            mask = _expand_line(_HIRES_MASKS, codes.translate(glyph_row))
+            lines.append((fg & mask) | (bg & ~mask))
+    return _pack_lines(lines)
+
+
+def _render_multicolor_text(screen_ram: bytes, color_ram: bytes, char_data: bytes | None, bg_colors: list[int]) -> bytes:
+    """Multicolor text: cells with color RAM bit 3 set use 4 colours at half resolution."""
+    glyph_rows = _glyph_rows(char_data)
+    bg = _fill_line(bg_colors[0])
+    bg1 = _fill_line(bg_colors[1])
+    bg2 = _fill_line(bg_colors[2])
+    lines = []
+    for cell in range(0, 1000, 40):
+        codes = screen_ram[cell:cell + 40]
+        cell_colors = color_ram[cell:cell + 40]
+        fg = _expand_line(_REPEAT8, cell_colors.translate(_LOW_NIBBLE))
+        multicolor_cells = _expand_line(_MULTICOLOR_FLAG_MASKS, cell_colors)
+        mc_colors = [bg, bg1, bg2, _expand_line(_REPEAT8, cell_colors.translate(_LOW_3_BITS))]
+        for glyph_row in glyph_rows:
+            data = codes.translate(glyph_row)
+            mask = _expand_line(_HIRES_MASKS, data)
+            hires = (fg & mask) | (bg & ~mask)
+            multi = _multicolor_line(mc_colors, data)
+            lines.append((multi & multicolor_cells) | (hires & ~multicolor_cells))
+    return _pack_lines(lines)
+
+
+def _render_extended_bg_text(screen_ram: bytes, color_ram: bytes, char_data: bytes | None, bg_colors: list[int]) -> bytes:
+    """Extended background colour: 64 characters, top 2 bits pick one of 4 backgrounds."""
+    glyph_rows = _glyph_rows(char_data)
+    bg_select = bytes(bg_colors[byte >> 6] for byte in range(256))
+    lines = []
+    for cell in range(0, 1000, 40):
+        cells = screen_ram[cell:cell + 40]
+        codes = cells.translate(_ECM_CHAR_CODE)
+        fg = _expand_line(_REPEAT8, color_ram[cell:cell + 40].translate(_LOW_NIBBLE))
+        bg = _expand_line(_REPEAT8, cells.translate(bg_select))
+        for glyph_row in glyph_rows:
+            mask = _expand_line(_HIRES_MASKS, codes.translate(glyph_row))
+            lines.append((fg & mask) | (bg & ~mask))
+    return _pack_lines(lines)
+
+
+def _render_standard_bitmap(screen_ram: bytes, bitmap_data: bytes) -> bytes:
+    """Hires bitmap: screen RAM nibbles give the 2 colours of each 8x8 block."""
+    bitmap_data = bytes(bitmap_data).ljust(8000, b"\x00")
+    lines = []
+    for cell in range(0, 1000, 40):
+        cells = screen_ram[cell:cell + 40]
+        fg = _expand_line(_REPEAT8, cells.translate(_HIGH_NIBBLE))
+        bg = _expand_line(_REPEAT8, cells.translate(_LOW_NIBBLE))
+        base = cell * 8
+        for row in range(8):
+            # Every 8th byte from the row offset is this raster line of each block
+            mask = _expand_line(_HIRES_MASKS, bitmap_data[base + row:base + 320:8])
+            lines.append((fg & mask) | (bg & ~mask))
+    return _pack_lines(lines)
+
+
+def _render_multicolor_bitmap(screen_ram: bytes, color_ram: bytes, bitmap_data: bytes, bg_color: int) -> bytes:
+    """Multicolor bitmap: 160x200 double-wide pixels, 4 colours per 8x8 block."""
+    bitmap_data = bytes(bitmap_data).ljust(8000, b"\x00")
+    bg = _fill_line(bg_color)
+    lines = []
+    for cell in range(0, 1000, 40):
+        cells = screen_ram[cell:cell + 40]
+        # %00 = background, %01 = screen high nibble, %10 = screen low nibble, %11 = color RAM
+        colors = [
+            bg,
+            _expand_line(_REPEAT8, cells.translate(_HIGH_NIBBLE)),
+            _expand_line(_REPEAT8, cells.translate(_LOW_NIBBLE)),
+            _expand_line(_REPEAT8, color_ram[cell:cell + 40].translate(_LOW_NIBBLE)),
+        ]
+        base = cell * 8
+        for row in range(8):
+            lines.append(_multicolor_line(colors, bitmap_data[base + row:base + 320:8]))
+    return _pack_lines(lines)
+
+
+def _compose_image(pixels: bytes, border_color: int, include_border: bool, scale: int) -> Image.Image:
+    """Place a rendered 320x200 frame inside the border and scale it up."""
+    border_size = 32 if include_border else 0
+    img = Image.new('P', (320 + border_size * 2, 200 + border_size * 2), border_color)
+    # frombuffer wraps the rendered bytes without copying them; paste does the only copy
+    img.paste(Image.frombuffer('P', (320, 200), pixels, 'raw', 'P', 0, 1), (border_size, border_size))
+    img.putpalette(C64_PALETTE_BYTES)
+
+    if scale > 1:
+        img = img.resize((img.width * scale, img.height * scale), Image.NEAREST)
+    return img
+
+
+def _encode_png(img: Image.Image) -> str:
+    """
+    Encode a rendered screen as base64 PNG data.
+    Palette-indexed PNGs are smaller than RGB and much faster to compress.
+    """
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG', compress_level=1)
+    # Encode straight from the buffer's memory rather than a getvalue() copy
+    return binascii.b2a_base64(buffer.getbuffer(), newline=False).decode('ascii')
+
+
+async def capture_screen_logic(client: httpx.AsyncClient, scale: int = 2, include_border: bool = True) -> ScreenImage:
     # Pause machine before capturing to ensure consistent screen state
-    await client.put("/v1/machine:pause")
+    await client.put(PAUSE_PATH)
 
     try:
         vic_state = await read_vic_state(client)
@@ -199,206 +398,44 @@ async def capture_screen_logic(client: httpx.AsyncClient, scale: int = 2, includ
         bg_colors = vic_state["bg_colors"]
         cia2_pra = vic_state["cia2_pra"]
 
-        # Read color RAM ($D800, always at fixed location)
-        resp = await client.get("/v1/machine:readmem", params={"address": "D800", "length": 1000})
-        resp.raise_for_status()
-        color_ram = resp.content
-
-        # Read screen RAM
-        resp = await client.get("/v1/machine:readmem", params={
-            "address": f"{screen_addr:04X}", "length": 1000
-        })
-        resp.raise_for_status()
-        screen_ram = resp.content
-
-        # For text modes, read character data (ROM or RAM based on VIC config)
+        # Read color RAM ($D800, always at fixed location), screen RAM and
+        # either the bitmap or the character data (ROM or RAM based on VIC
+        # config) together
         char_data = None
-        if not bmm:
-            char_data = await _read_charset_data(client, vic_state)
-
-        # Read bitmap data if in bitmap mode
         bitmap_data = None
         if bmm:
-            resp = await client.get("/v1/machine:readmem", params={
-                "address": f"{bitmap_addr:04X}", "length": 8000
-            })
-            resp.raise_for_status()
-            bitmap_data = resp.content
+            color_ram, screen_ram, bitmap_data = await asyncio.gather(
+                _read_memory(client, 0xD800, 1000),
+                _read_memory(client, screen_addr, 1000),
+                _read_memory(client, bitmap_addr, 8000),
+            )
+        else:
+            color_ram, screen_ram, char_data = await asyncio.gather(
+                _read_memory(client, 0xD800, 1000),
+                _read_memory(client, screen_addr, 1000),
+                _read_charset_data(client, vic_state),
+            )
 
     finally:
         # Resume machine as soon as memory is read
-        await client.put("/v1/machine:resume")
-
-    # Image dimensions
-    pixel_width = 320
-    pixel_height = 200
-    border_size = 32 if include_border else 0
-    img_width = pixel_width + (border_size * 2)
-    img_height = pixel_height + (border_size * 2)
-
-    img = Image.new('RGB', (img_width, img_height), C64_PALETTE[border_color])
-    
-    # We'll render to a pixel buffer first for speed
-    pixels = [[C64_PALETTE[bg_colors[0]] for _ in range(320)] for _ in range(200)]
+        await client.put(RESUME_PATH)
 
     if bmm:
         if mcm:
-            # Multicolor Bitmap: 160x200 double-wide pixels, 4 colors per 8x8 block
-            for char_y in range(25):
-                for char_x in range(40):
-                    cell_idx = char_y * 40 + char_x
-                    screen_byte = screen_ram[cell_idx]
-                    color_byte = color_ram[cell_idx]
-                    
-                    # Colors: 
-                    # %00 = background ($D021)
-                    # %01 = upper 4 bits of screen RAM
-                    # %10 = lower 4 bits of screen RAM
-                    # %11 = color RAM
-                    block_colors = [
-                        bg_colors[0],
-                        (screen_byte >> 4) & 0x0F,
-                        screen_byte & 0x0F,
-                        color_byte & 0x0F
-                    ]
-                    
-                    bitmap_offset = cell_idx * 8
-                    for row in range(8):
-                        byte = bitmap_data[bitmap_offset + row]
-                        for col in range(4):
-                            shift = 6 - (col * 2)
-                            color_idx = (byte >> shift) & 0x03
-                            color = block_colors[color_idx]
-                            px = char_x * 8 + col * 2
-                            py = char_y * 8 + row
-                            pixels[py][px] = C64_PALETTE[color]
-                            pixels[py][px+1] = C64_PALETTE[color]
+            pixels = _render_multicolor_bitmap(screen_ram, color_ram, bitmap_data, bg_colors[0])
         else:
-            # Standard Bitmap: 320x200, 2 colors per 8x8 block
-            for char_y in range(25):
-                for char_x in range(40):
-                    cell_idx = char_y * 40 + char_x
-                    screen_byte = screen_ram[cell_idx]
-                    fg_color = (screen_byte >> 4) & 0x0F
-                    bg_color = screen_byte & 0x0F
-                    
-                    bitmap_offset = cell_idx * 8
-                    for row in range(8):
-                        byte = bitmap_data[bitmap_offset + row]
-                        for col in range(8):
-                            px = char_x * 8 + col
-                            py = char_y * 8 + row
-                            if byte & (0x80 >> col):
-                                pixels[py][px] = C64_PALETTE[fg_color]
-                            else:
-                                pixels[py][px] = C64_PALETTE[bg_color]
-    
+            pixels = _render_standard_bitmap(screen_ram, bitmap_data)
     elif ecm:
-        # Extended Background Color Mode: 40x25, 64 chars, 4 background colors
-        for char_y in range(25):
-            for char_x in range(40):
-                cell_idx = char_y * 40 + char_x
-                screen_byte = screen_ram[cell_idx]
-                fg_color = color_ram[cell_idx] & 0x0F
-                
-                # Top 2 bits select background color, remaining 6 bits are char code
-                bg_select = (screen_byte >> 6) & 0x03
-                char_code = screen_byte & 0x3F
-                cell_bg = bg_colors[bg_select]
-                
-                # Get character bitmap from actual memory
-                char_offset_local = char_code * 8
-                char_bitmap = char_data[char_offset_local:char_offset_local + 8]
-
-                # Render character
-                for row in range(8):
-                    byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                    for col in range(8):
-                        px = char_x * 8 + col
-                        py = char_y * 8 + row
-                        if byte & (0x80 >> col):
-                            pixels[py][px] = C64_PALETTE[fg_color]
-                        else:
-                            pixels[py][px] = C64_PALETTE[cell_bg]
-
+        pixels = _render_extended_bg_text(screen_ram, color_ram, char_data, bg_colors)
     elif mcm:
-        # Multicolor Text Mode: 40x25, chars with color bit 3 set use multicolor
-        for char_y in range(25):
-            for char_x in range(40):
-                cell_idx = char_y * 40 + char_x
-                char_code = screen_ram[cell_idx]
-                color_byte = color_ram[cell_idx]
-                fg_color = color_byte & 0x0F
-                is_multicolor = bool(color_byte & 0x08)
-                
-                # Get character bitmap from actual memory
-                char_offset_local = char_code * 8
-                char_bitmap = char_data[char_offset_local:char_offset_local + 8]
-
-                if is_multicolor:
-                    # Multicolor: 4x8 double-wide pixels, 4 colors
-                    mc_colors = [
-                        bg_colors[0],      # %00 - background
-                        bg_colors[1],      # %01 - $D022
-                        bg_colors[2],      # %10 - $D023
-                        fg_color & 0x07    # %11 - color RAM (low 3 bits only)
-                    ]
-                    for row in range(8):
-                        byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                        for col in range(4):
-                            shift = 6 - (col * 2)
-                            color_idx = (byte >> shift) & 0x03
-                            color = mc_colors[color_idx]
-                            px = char_x * 8 + col * 2
-                            py = char_y * 8 + row
-                            pixels[py][px] = C64_PALETTE[color]
-                            pixels[py][px + 1] = C64_PALETTE[color]
-                else:
-                    # Standard character rendering
-                    for row in range(8):
-                        byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                        for col in range(8):
-                            px = char_x * 8 + col
-                            py = char_y * 8 + row
-                            if byte & (0x80 >> col):
-                                pixels[py][px] = C64_PALETTE[fg_color]
-                            # else: keep background
-
+        pixels = _render_multicolor_text(screen_ram, color_ram, char_data, bg_colors)
     else:
-        # Standard Text Mode: 40x25 characters
-        for char_y in range(25):
-            for char_x in range(40):
-                cell_idx = char_y * 40 + char_x
-                char_code = screen_ram[cell_idx]
-                fg_color = color_ram[cell_idx] & 0x0F
-                
-                # Get character bitmap from actual memory
-                char_offset_local = char_code * 8
-                char_bitmap = char_data[char_offset_local:char_offset_local + 8]
-
-                # Render character
-                for row in range(8):
-                    byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                    for col in range(8):
-                        px = char_x * 8 + col
-                        py = char_y * 8 + row
-                        if byte & (0x80 >> col):
-                            pixels[py][px] = C64_PALETTE[fg_color]
-                        # else: keep background color
-
-    # Copy pixel buffer to image
-    for y in range(pixel_height):
-        for x in range(pixel_width):
-            img.putpixel((x + border_size, y + border_size), pixels[y][x])
-
-    # Scale the image
-    if scale > 1:
-        img = img.resize((img_width * scale, img_height * scale), Image.NEAREST)
+        pixels = _render_standard_text(screen_ram, color_ram, char_data, bg_colors[0])
+
+    img = _compose_image(pixels, border_color, include_border, scale)
 
     # Convert to PNG base64
-    buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    png_base64 = base64.b64encode(buffer.getvalue()).decode('ascii')
+    png_base64 = _encode_png(img)
 
     # Build mode info string
     mode_str = f"Mode: {mode.display_name} | VIC Bank: ${vic_bank:04X} | Screen: ${screen_addr:04X}"
@@ -407,12 +444,7 @@ async def capture_screen_logic(client: httpx.AsyncClient, scale: int = 2, includ
     else:
         mode_str += f" | Charset: ${char_addr:04X}"
 
-    return {
-        "type": "image",
-        "data": png_base64,
-        "mimeType": "image/png",
-        "info": mode_str
-    }
+    return ScreenImage(data=png_base64, info=mode_str)
 
 
 def _render_screen_for_mode(
@@ -436,156 +468,38 @@ def _render_screen_for_mode(
     ecm = mode in (ScreenMode.EXTENDED_BG_COLOR, ScreenMode.INVALID_ECM_BMM, ScreenMode.INVALID_ECM_MCM)
     mcm = mode in (ScreenMode.MULTICOLOR_TEXT, ScreenMode.MULTICOLOR_BITMAP, ScreenMode.INVALID_ECM_MCM)
 
-    # Image dimensions
-    pixel_width = 320
-    pixel_height = 200
-    border_size = 32 if include_border else 0
-    img_width = pixel_width + (border_size * 2)
-    img_height = pixel_height + (border_size * 2)
-
-    img = Image.new('RGB', (img_width, img_height), C64_PALETTE[border_color])
-    pixels = [[C64_PALETTE[bg_colors[0]] for _ in range(320)] for _ in range(200)]
-
     if mode == ScreenMode.MULTICOLOR_BITMAP:
-        # Multicolor Bitmap: 160x200 double-wide pixels, 4 colors per 8x8 block
         if bitmap_data:
-            for char_y in range(25):
-                for char_x in range(40):
-                    cell_idx = char_y * 40 + char_x
-                    screen_byte = screen_ram[cell_idx]
-                    color_byte = color_ram[cell_idx]
-                    block_colors = [
-                        bg_colors[0],
-                        (screen_byte >> 4) & 0x0F,
-                        screen_byte & 0x0F,
-                        color_byte & 0x0F
-                    ]
-                    bitmap_offset = cell_idx * 8
-                    for row in range(8):
-                        byte = bitmap_data[bitmap_offset + row]
-                        for col in range(4):
-                            shift = 6 - (col * 2)
-                            color_idx = (byte >> shift) & 0x03
-                            color = block_colors[color_idx]
-                            px = char_x * 8 + col * 2
-                            py = char_y * 8 + row
-                            pixels[py][px] = C64_PALETTE[color]
-                            pixels[py][px + 1] = C64_PALETTE[color]
-
+            pixels = _render_multicolor_bitmap(screen_ram, color_ram, bitmap_data, bg_colors[0])
+        else:
+            pixels = bytes([bg_colors[0]]) * 64000
     elif mode == ScreenMode.STANDARD_BITMAP:
-        # Standard Bitmap: 320x200, 2 colors per 8x8 block
         if bitmap_data:
-            for char_y in range(25):
-                for char_x in range(40):
-                    cell_idx = char_y * 40 + char_x
-                    screen_byte = screen_ram[cell_idx]
-                    fg_color = (screen_byte >> 4) & 0x0F
-                    bg_color = screen_byte & 0x0F
-                    bitmap_offset = cell_idx * 8
-                    for row in range(8):
-                        byte = bitmap_data[bitmap_offset + row]
-                        for col in range(8):
-                            px = char_x * 8 + col
-                            py = char_y * 8 + row
-                            if byte & (0x80 >> col):
-                                pixels[py][px] = C64_PALETTE[fg_color]
-                            else:
-                                pixels[py][px] = C64_PALETTE[bg_color]
-
+            pixels = _render_standard_bitmap(screen_ram, bitmap_data)
+        else:
+            pixels = bytes([bg_colors[0]]) * 64000
     elif mode == ScreenMode.EXTENDED_BG_COLOR:
-        # Extended Background Color Mode: 40x25, 64 chars, 4 background colors
-        for char_y in range(25):
-            for char_x in range(40):
-                cell_idx = char_y * 40 + char_x
-                screen_byte = screen_ram[cell_idx]
-                fg_color = color_ram[cell_idx] & 0x0F
-                bg_select = (screen_byte >> 6) & 0x03
-                char_code = screen_byte & 0x3F
-                cell_bg = bg_colors[bg_select]
-                char_offset_local = char_code * 8
-                char_bitmap = char_data[char_offset_local:char_offset_local + 8] if char_data else bytes(8)
-                for row in range(8):
-                    byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                    for col in range(8):
-                        px = char_x * 8 + col
-                        py = char_y * 8 + row
-                        if byte & (0x80 >> col):
-                            pixels[py][px] = C64_PALETTE[fg_color]
-                        else:
-                            pixels[py][px] = C64_PALETTE[cell_bg]
-
+        pixels = _render_extended_bg_text(screen_ram, color_ram, char_data, bg_colors)
     elif mode == ScreenMode.MULTICOLOR_TEXT:
-        # Multicolor Text Mode: 40x25, chars with color bit 3 set use multicolor
-        for char_y in range(25):
-            for char_x in range(40):
-                cell_idx = char_y * 40 + char_x
-                char_code = screen_ram[cell_idx]
-                color_byte = color_ram[cell_idx]
-                fg_color = color_byte & 0x0F
-                is_multicolor = bool(color_byte & 0x08)
-                char_offset_local = char_code * 8
-                char_bitmap = char_data[char_offset_local:char_offset_local + 8] if char_data else bytes(8)
-                if is_multicolor:
-                    mc_colors = [
-                        bg_colors[0],
-                        bg_colors[1],
-                        bg_colors[2],
-                        fg_color & 0x07
-                    ]
-                    for row in range(8):
-                        byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                        for col in range(4):
-                            shift = 6 - (col * 2)
-                            color_idx = (byte >> shift) & 0x03
-                            color = mc_colors[color_idx]
-                            px = char_x * 8 + col * 2
-                            py = char_y * 8 + row
-                            pixels[py][px] = C64_PALETTE[color]
-                            pixels[py][px + 1] = C64_PALETTE[color]
-                else:
-                    for row in range(8):
-                        byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                        for col in range(8):
-                            px = char_x * 8 + col
-                            py = char_y * 8 + row
-                            if byte & (0x80 >> col):
-                                pixels[py][px] = C64_PALETTE[fg_color]
-
+        pixels = _render_multicolor_text(screen_ram, color_ram, char_data, bg_colors)
     else:
         # Standard Text Mode (default) or invalid modes
-        for char_y in range(25):
-            for char_x in range(40):
-                cell_idx = char_y * 40 + char_x
-                char_code = screen_ram[cell_idx]
-                fg_color = color_ram[cell_idx] & 0x0F
-                char_offset_local = char_code * 8
-                char_bitmap = char_data[char_offset_local:char_offset_local + 8] if char_data else bytes(8)
-                for row in range(8):
-                    byte = char_bitmap[row] if row < len(char_bitmap) else 0
-                    for col in range(8):
-                        px = char_x * 8 + col
-                        py = char_y * 8 + row
-                        if byte & (0x80 >> col):
-                            pixels[py][px] = C64_PALETTE[fg_color]
-
-    # Copy pixel buffer to image
-    for y in range(pixel_height):
-        for x in range(pixel_width):
-            img.putpixel((x + border_size, y + border_size), pixels[y][x])
-
-    # Scale the image
-    if scale > 1:
-        img = img.resize((img_width * scale, img_height * scale), Image.NEAREST)
+        pixels = _render_standard_text(screen_ram, color_ram, char_data, bg_colors[0])
+
+    img = _compose_image(pixels, border_color, include_border, scale)
 
     # Convert to PNG base64
-    buffer = io.BytesIO()
-    img.save(buffer, format='PNG')
-    png_base64 = base64.b64encode(buffer.getvalue()).decode('ascii')
+    png_base64 = _encode_png(img)
 
     mode_info = f"Mode: {mode.display_name}"
     return png_base64, mode_info
 
 
+# Uppercase/graphics ROM charset. Characters 128-255 are the reverse-video
+# forms of 0-127, so they are derived by inverting the first 128 glyphs
+_ROM_CHARSET = C64_CHARSET[:1024] + bytes(byte ^ 0xFF for byte in C64_CHARSET[:1024])
+
+
 def _get_builtin_charset(uppercase: bool = True) -> bytes:
     """
     Get the built-in C64 character ROM data.
@@ -603,7 +517,7 @@ def _get_builtin_charset(uppercase: bool = True) -> bytes:
     """
     if uppercase:
         # First 2KB: uppercase/graphics (default C64 charset)
-        return bytes(C64_CHARSET[:2048])
+        return _ROM_CHARSET
     else:
         # Second 2KB: lowercase characters
         # If C64_CHARSET contains both sets (4KB), return the second half
@@ -611,7 +525,7 @@ def _get_builtin_charset(uppercase: bool = True) -> bytes:
             return bytes(C64_CHARSET[2048:4096])
         else:
             # Fallback to uppercase if lowercase not available
-            return bytes(C64_CHARSET[:2048])
+            return _ROM_CHARSET
 
 
 async def _read_charset_data(client: httpx.AsyncClient, vic_state: dict) -> bytes:
@@ -669,12 +583,7 @@ async def _read_charset_data(client: httpx.AsyncClient, vic_state: dict) -> byte
     else:
         # Read custom character set from RAM
         # char_addr is already calculated as vic_bank + char_offset
-        resp = await client.get("/v1/machine:readmem", params={
-            "address": f"{char_addr:04X}",
-            "length": 2048
-        })
-        resp.raise_for_status()
-        char_data = resp.content
+        char_data = await _read_memory(client, char_addr, 2048)
 
     return char_data
 
@@ -684,27 +593,15 @@ async def _read_all_screen_data(client: httpx.AsyncClient, vic_state: dict) -> d
     screen_addr = vic_state["screen_addr"]
     bitmap_addr = vic_state["bitmap_addr"]
 
-    # Read color RAM ($D800, always at fixed location)
-    resp = await client.get("/v1/machine:readmem", params={"address": "D800", "length": 1000})
-    resp.raise_for_status()
-    color_ram = resp.content
-
-    # Read screen RAM
-    resp = await client.get("/v1/machine:readmem", params={
-        "address": f"{screen_addr:04X}", "length": 1000
-    })
-    resp.raise_for_status()
-    screen_ram = resp.content
-
-    # Read character data (handles both ROM and RAM based on VIC configuration)
-    char_data = await _read_charset_data(client, vic_state)
-
-    # Read bitmap data (needed for bitmap modes)
-    resp = await client.get("/v1/machine:readmem", params={
-        "address": f"{bitmap_addr:04X}", "length": 8000
-    })
-    resp.raise_for_status()
-    bitmap_data = resp.content
+    # The reads are independent, so issue them together: color RAM ($D800,
+    # always at fixed location), screen RAM, character data (ROM or RAM based
+    # on VIC configuration) and bitmap data (needed for bitmap modes)
+    color_ram, screen_ram, char_data, bitmap_data = await asyncio.gather(
+        _read_memory(client, 0xD800, 1000),
+        _read_memory(client, screen_addr, 1000),
+        _read_charset_data(client, vic_state),
+        _read_memory(client, bitmap_addr, 8000),
+    )
 
     return {
         "screen_ram": screen_ram,
@@ -719,17 +616,17 @@ async def capture_screen_with_mode_logic(
     mode: ScreenMode,
     scale: int = 2,
     include_border: bool = True
-) -> dict:
+) -> ScreenImage:
     """
     Capture screen using an explicit mode, ignoring the active VIC-II mode.
     Useful when the auto-detection may not match the expected rendering.
     """
-    await client.put("/v1/machine:pause")
+    await client.put(PAUSE_PATH)
     try:
         vic_state = await read_vic_state(client)
         screen_data = await _read_all_screen_data(client, vic_state)
     finally:
-        await client.put("/v1/machine:resume")
+        await client.put(RESUME_PATH)
 
     png_base64, mode_info = _render_screen_for_mode(
         mode=mode,
@@ -747,12 +644,7 @@ async def capture_screen_with_mode_logic(
     screen_addr = vic_state["screen_addr"]
     mode_str = f"{mode_info} | VIC Bank: ${vic_bank:04X} | Screen: ${screen_addr:04X}"
 
-    return {
-        "type": "image",
-        "data": png_base64,
-        "mimeType": "image/png",
-        "info": mode_str
-    }
+    return ScreenImage(data=png_base64, info=mode_str)
 
 
 async def capture_screen_with_config_logic(
@@ -763,7 +655,7 @@ async def capture_screen_with_config_logic(
     bitmap_addr: int | None = None,
     scale: int = 2,
     include_border: bool = True
-) -> dict:
+) -> ScreenImage:
     """
     Capture screen using explicit mode AND memory addresses.
     Ignores VIC-II register detection entirely - uses provided addresses.
@@ -776,12 +668,41 @@ async def capture_screen_with_config_logic(
         scale: Output image scale factor
         include_border: Include border in output
     """
-    await client.put("/v1/machine:pause")
+    # Determine if we need char data or bitmap data based on mode
+    is_bitmap_mode = mode in (ScreenMode.STANDARD_BITMAP, ScreenMode.MULTICOLOR_BITMAP)
+
+    char_data = None
+    bitmap_data = None
+
+    await client.put(PAUSE_PATH)
     try:
-        # Read VIC registers just for colors
-        resp = await client.get("/v1/machine:readmem", params={"address": "D000", "length": 48})
-        resp.raise_for_status()
-        vic_regs = resp.content
+        # Read the VIC registers (just for colors), color RAM ($D800, always
+        # at fixed location), screen RAM from the specified address and the
+        # bitmap or character data together
+        if is_bitmap_mode:
+            bmp_addr = bitmap_addr if bitmap_addr is not None else 0x2000
+            vic_regs, color_ram, screen_ram, bitmap_data = await asyncio.gather(
+                _read_memory(client, 0xD000, 48),
+                _read_memory(client, 0xD800, 1000),
+                _read_memory(client, screen_addr, 1000),
+                _read_memory(client, bmp_addr, 8000),
+            )
+        elif char_addr is not None:
+            # Text mode with character data read from the specified RAM address
+            vic_regs, color_ram, screen_ram, char_data = await asyncio.gather(
+                _read_memory(client, 0xD000, 48),
+                _read_memory(client, 0xD800, 1000),
+                _read_memory(client, screen_addr, 1000),
+                _read_memory(client, char_addr, 2048),
+            )
+        else:
+            # Text mode using the built-in character ROM (uppercase/graphics set)
+            vic_regs, color_ram, screen_ram = await asyncio.gather(
+                _read_memory(client, 0xD000, 48),
+                _read_memory(client, 0xD800, 1000),
+                _read_memory(client, screen_addr, 1000),
+            )
+            char_data = _get_builtin_charset(uppercase=True)
 
         d020 = vic_regs[0x20]  # Border color
         d021 = vic_regs[0x21]  # Background color 0
@@ -792,47 +713,8 @@ async def capture_screen_with_config_logic(
         border_color = d020 & 0x0F
         bg_colors = [d021 & 0x0F, d022 & 0x0F, d023 & 0x0F, d024 & 0x0F]
 
-        # Read color RAM ($D800, always at fixed location)
-        resp = await client.get("/v1/machine:readmem", params={"address": "D800", "length": 1000})
-        resp.raise_for_status()
-        color_ram = resp.content
-
-        # Read screen RAM from specified address
-        resp = await client.get("/v1/machine:readmem", params={
-            "address": f"{screen_addr:04X}", "length": 1000
-        })
-        resp.raise_for_status()
-        screen_ram = resp.content
-
-        # Determine if we need char data or bitmap data based on mode
-        is_bitmap_mode = mode in (ScreenMode.STANDARD_BITMAP, ScreenMode.MULTICOLOR_BITMAP)
-
-        char_data = None
-        bitmap_data = None
-
-        if is_bitmap_mode:
-            # Read bitmap data
-            bmp_addr = bitmap_addr if bitmap_addr is not None else 0x2000
-            resp = await client.get("/v1/machine:readmem", params={
-                "address": f"{bmp_addr:04X}", "length": 8000
-            })
-            resp.raise_for_status()
-            bitmap_data = resp.content
-        else:
-            # Text mode - read character data
-            if char_addr is not None:
-                # Read from specified RAM address
-                resp = await client.get("/v1/machine:readmem", params={
-                    "address": f"{char_addr:04X}", "length": 2048
-                })
-                resp.raise_for_status()
-                char_data = resp.content
-            else:
-                # Use built-in character ROM (uppercase/graphics set)
-                char_data = _get_builtin_charset(uppercase=True)
-
     finally:
-        await client.put("/v1/machine:resume")
+        await client.put(RESUME_PATH)
 
     png_base64, mode_info = _render_screen_for_mode(
         mode=mode,
@@ -857,12 +739,7 @@ async def capture_screen_with_config_logic(
         else:
             mode_str += " | Charset: ROM"
 
-    return {
-        "type": "image",
-        "data": png_base64,
-        "mimeType": "image/png",
-        "info": mode_str
-    }
+    return ScreenImage(data=png_base64, info=mode_str)
 
 
 # Valid modes for capture_all (excluding invalid combinations)
@@ -879,21 +756,23 @@ async def capture_all_screen_modes_logic(
     client: httpx.AsyncClient,
     scale: int = 2,
     include_border: bool = True
-) -> list[dict]:
+) -> list[ScreenImage]:
     """
     Capture screenshots for all valid screen modes at once.
     Returns a list of image results, one for each mode.
     """
-    await client.put("/v1/machine:pause")
+    await client.put(PAUSE_PATH)
     try:
         vic_state = await read_vic_state(client)
         screen_data = await _read_all_screen_data(client, vic_state)
     finally:
-        await client.put("/v1/machine:resume")
+        await client.put(RESUME_PATH)
 
-    results = []
-    for mode in VALID_SCREEN_MODES:
-        png_base64, mode_info = _render_screen_for_mode(
+    # Render all modes from the same snapshot concurrently in worker threads,
+    # keeping the event loop free while the images are built and encoded
+    renders = await asyncio.gather(*(
+        asyncio.to_thread(
+            _render_screen_for_mode,
             mode=mode,
             screen_ram=screen_data["screen_ram"],
             color_ram=screen_data["color_ram"],
@@ -904,12 +783,7 @@ async def capture_all_screen_modes_logic(
             scale=scale,
             include_border=include_border,
         )
-        results.append({
-            "type": "image",
-            "data": png_base64,
-            "mimeType": "image/png",
-            "mode": mode.value,
-            "info": mode_info
-        })
-
-    return results
+        for mode in VALID_SCREEN_MODES
+    ))
+
+    return [ScreenImage(data=png_base64, info=mode_info) for png_base64, mode_info in renders]
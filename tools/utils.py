@@ -1,48 +1,99 @@
 import base64
+import binascii
 import re
+from typing import AsyncIterator
 
 from tools.c64_data import SPECIAL_KEYS
 
+# Uploads with at least this many base64 characters are decoded while being sent
+STREAM_UPLOAD_THRESHOLD = 64 * 1024
 
-def decode_base64_data(data: str) -> bytes:
-    """Decode base64 data, handling both pure base64 and data URL formats."""
-    # Strip data URL prefix if present (e.g., "data:application/octet-stream;base64,...")
+# Base64 characters decoded per streamed chunk
+_B64_STREAM_CHUNK = 64 * 1024
+
+# Base64 that can be streamed with an exact Content-Length: only alphabet
+# characters and line breaks/spaces, with padding at the very end
+_B64_WHITESPACE = " \t\r\n"
+_STREAMABLE_B64_RE = re.compile(r'[A-Za-z0-9+/ \t\r\n]*(?:=[ \t\r\n]*){0,2}')
+
+
+def strip_data_url(data: str) -> str:
+    """Strip a data URL prefix (e.g., "data:application/octet-stream;base64,") if present."""
     if data.startswith("data:"):
         data = data.split(",", 1)[1]
-    return base64.b64decode(data)
+    return data
+
+
+def decode_base64_data(data: str) -> bytes:
+    """Decode base64 data, handling both pure base64 and data URL formats."""
+    return base64.b64decode(strip_data_url(data))
+
+
+async def _iter_base64_chunks(data: str) -> AsyncIterator[bytes]:
+    """Decode base64 text in fixed-size windows, yielding the decoded bytes."""
+    carry = ""
+    for i in range(0, len(data), _B64_STREAM_CHUNK):
+        # Drop line breaks and decode whole 4-character groups, carrying any
+        # partial group over to the next window
+        window = carry + "".join(data[i:i + _B64_STREAM_CHUNK].split())
+        cut = len(window) - len(window) % 4
+        carry = window[cut:]
+        if cut:
+            yield binascii.a2b_base64(window[:cut])
+
+
+def base64_upload(data: str) -> tuple[bytes | AsyncIterator[bytes], dict[str, str]]:
+    """Prepare a base64 or data URL encoded upload as an httpx request body.
+
+    Returns (content, headers) to pass to the request. Large payloads are
+    decoded chunk by chunk while the body is sent, so the whole decoded file
+    never sits in memory next to the base64 string. An explicit
+    Content-Length keeps the body a plain (non-chunked) upload for the device.
+    Small payloads, or ones with characters outside the base64 alphabet, are
+    decoded in one go.
+    """
+    data = strip_data_url(data)
+    if len(data) >= STREAM_UPLOAD_THRESHOLD and _STREAMABLE_B64_RE.fullmatch(data):
+        significant = len(data) - sum(map(data.count, _B64_WHITESPACE))
+        if significant % 4 == 0:
+            length = significant // 4 * 3 - data.count("=")
+            return _iter_base64_chunks(data), {"Content-Length": str(length)}
+
+    content = base64.b64decode(data)
+    return content, {"Content-Length": str(len(content))}
+
+
+# Special key placeholders like {RETURN}; the group keeps them in re.split output
+_PLACEHOLDER_RE = re.compile(r'(\{[A-Z0-9_]+\})')
+
+# Characters that map directly onto PETSCII keyboard codes. Lowercase letters
+# are folded to uppercase; every other byte is dropped
+_PETSCII_TABLE = bytes.maketrans(b'abcdefghijklmnopqrstuvwxyz', b'ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_PETSCII_KEEP = frozenset(
+    b' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[]^abcdefghijklmnopqrstuvwxyz'
+)
+_PETSCII_DELETE = bytes(b for b in range(256) if b not in _PETSCII_KEEP)
+
+
+def _text_to_petscii(text: str) -> bytes:
+    """Convert a run of plain text (no placeholders) to PETSCII keyboard codes."""
+    return text.encode('latin-1', 'ignore').translate(_PETSCII_TABLE, _PETSCII_DELETE)
+
 
 def ascii_to_petscii(text: str) -> bytes:
     """Convert ASCII/Unicode text to PETSCII keyboard codes.
 
     Supports special key placeholders like {RETURN}, {HOME}, {CLR}, etc.
     """
-    result = []
-
-    # Find all special keys and regular text segments
-    pattern = r'(\{[A-Z0-9_]+\})'
-    parts = re.split(pattern, text)
-
-    for part in parts:
+    result = bytearray()
+    for part in _PLACEHOLDER_RE.split(text):
         if part.startswith('{') and part.endswith('}'):
             # Special key placeholder
-            upper_part = part.upper()
-            if upper_part in SPECIAL_KEYS:
-                result.append(SPECIAL_KEYS[upper_part])
+            code = SPECIAL_KEYS.get(part.upper())
+            if code is not None:
+                result.append(code)
             # Skip unknown placeholders
         else:
             # Regular text
-            for char in part:
-                code = ord(char)
-                if char == ' ':
-                    result.append(32)  # Space
-                elif 'A' <= char <= 'Z':
-                    result.append(code)
-                elif 'a' <= char <= 'z':
-                    # Lowercase -> uppercase PETSCII
-                    result.append(code - 32)
-                elif '0' <= char <= '9':
-                    result.append(code)
-                elif char in '!"#$%&\'()*+,-./:;<=>?@[]^':
-                    result.append(code)
-                # Skip other unmapped characters
+            result += _text_to_petscii(part)
     return bytes(result)
\ No newline at end of file